@@ -1,21 +1,31 @@
+import os
+import sys
+
 from app import create_app, db
 from app.models import DatasetAnalysis, DataPoint
 
 # Create the Flask application
 app = create_app()
 
-@app.cli.command()
-def init_db():
-    """Initialize the database"""
-    db.create_all()
-    print("Database initialized successfully!")
+# Database commands are only reachable through the Flask CLI, so skip
+# building them for servers and scripts
+_entry_point = os.path.normpath(sys.argv[0])
+if (os.getenv('FLASK_RUN_FROM_CLI')
+        or os.path.basename(_entry_point).startswith('flask')
+        or _entry_point.endswith(os.path.join('flask', '__main__.py'))):
+    @app.cli.command()
+    def init_db():
+        """Initialize the database"""
+        db.create_all()
+        print("Database initialized successfully!")
 
-@app.cli.command()
-def reset_db():
-    """Reset the database"""
-    db.drop_all()
-    db.create_all()
-    print("Database reset successfully!")
+    @app.cli.command()
+    def reset_db():
+        """Reset the database"""
+        db.drop_all()
+        db.create_all()
+        print("Database reset successfully!")
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Development server only; production runs under gunicorn (gunicorn.conf.py)
+    app.run(debug=os.getenv('FLASK_ENV') == 'development', host='0.0.0.0', port=5000)
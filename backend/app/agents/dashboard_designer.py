@@ -4,8 +4,99 @@ Responsible for creating dashboard layouts and visualization recommendations.
 """
 
 from crewai import Agent
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+from datetime import datetime, timezone
 import pandas as pd
+import numpy as np
+import functools
+import heapq
+import itertools
+import math
+import operator
+import re
+
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+# Categorical value counts are computed on at most this many rows; top values
+# and cardinality class are stable on a uniform sample of this size
+_CATEGORICAL_SAMPLE_ROWS = 50_000
+
+# Visualization types grouped into the overview and performance sections
+_OVERVIEW_TYPES = frozenset({'kpi_cards', 'line'})
+_PERFORMANCE_TYPES = frozenset({'bar', 'pie', 'scatter'})
+_type_and_priority = operator.itemgetter('type', 'priority')
+
+# Server-side aggregation tiers for chart data; M4 keeps four points per
+# pixel column, so the point budget implies the default chart width
+_AGGREGATION_LEVELS = (1, 10, 100, 1000)
+_MAX_POINTS_PER_CHART = 4000
+_DEFAULT_CHART_WIDTH_PX = _MAX_POINTS_PER_CHART // 4
+
+# Fixed design recommendation text
+_INTERACTIVITY_RECS = (
+    "Enable drill-down capabilities on summary charts for deeper analysis.",
+    "Add hover tooltips to charts for detailed information display."
+)
+_DOMAIN_RECS = {
+    'financial': ("Include variance analysis charts to compare actual vs. budget/forecast.",),
+    'sales': ("Add funnel charts to visualize the sales pipeline conversion process.",),
+    'marketing': ("Include attribution analysis to understand campaign effectiveness.",)
+}
+_USER_EXPERIENCE_RECS = (
+    "Implement auto-refresh functionality for real-time data updates.",
+    "Add export capabilities for charts and data tables.",
+    "Include contextual help tooltips for business users."
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _keyword_hits(pattern: re.Pattern, name_lower: str) -> int:
+    """Count distinct domain keywords in a column name (depends only on the schema)"""
+    return len(set(pattern.findall(name_lower)))
+
+
+def _exceeds_distinct(series: pd.Series, limit: int) -> bool:
+    """Check for more than `limit` distinct values, hashing geometrically growing
+    prefixes so varied columns exit after a few thousand rows"""
+    prefix = 1000
+    while prefix < len(series):
+        if series.iloc[:prefix].nunique() > limit:
+            return True
+        prefix *= 10
+    return series.nunique() > limit
+
+
+@functools.lru_cache(maxsize=128)
+def _design_recommendations(use_tabs: bool, add_line_charts: bool, lazy_loading: bool, domain: str) -> Tuple[str, ...]:
+    """Assemble design recommendation text; depends only on a few dashboard traits"""
+    recommendations = []
+    
+    # Layout recommendations
+    if use_tabs:
+        recommendations.append("Consider using tabs or accordion sections to organize visualizations for better user experience.")
+    
+    # Visualization type recommendations
+    if add_line_charts:
+        recommendations.append("Add line charts to better show trends over time.")
+    
+    # Interactivity recommendations
+    recommendations.extend(_INTERACTIVITY_RECS)
+    
+    # Performance recommendations
+    if lazy_loading:
+        recommendations.append("Implement lazy loading for better dashboard performance with many visualizations.")
+    
+    # Domain-specific recommendations
+    recommendations.extend(_DOMAIN_RECS.get(domain, ()))
+    
+    # User experience recommendations
+    recommendations.extend(_USER_EXPERIENCE_RECS)
+    
+    return tuple(recommendations)
 
 
 class DashboardDesigner:
@@ -26,13 +117,43 @@ class DashboardDesigner:
             'geographic': ['map', 'choropleth']
         }
         
-        # Color schemes for different contexts
+        # Color schemes for different contexts (immutable, since the same
+        # palette object is handed to every dashboard)
         self.color_schemes = {
-            'financial': ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd'],
-            'sales': ['#2E8B57', '#FF6347', '#4682B4', '#32CD32', '#FF4500'],
-            'marketing': ['#FF69B4', '#00CED1', '#FFD700', '#9370DB', '#FF1493'],
-            'operations': ['#808080', '#A52A2A', '#006400', '#FF8C00', '#4B0082'],
-            'default': ['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6']
+            'financial': ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd'),
+            'sales': ('#2E8B57', '#FF6347', '#4682B4', '#32CD32', '#FF4500'),
+            'marketing': ('#FF69B4', '#00CED1', '#FFD700', '#9370DB', '#FF1493'),
+            'operations': ('#808080', '#A52A2A', '#006400', '#FF8C00', '#4B0082'),
+            'default': ('#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6')
+        }
+        self._default_palette = self.color_schemes['default']
+        
+        # Domain-specific metric prioritization
+        self.metric_keywords = {
+            'financial': ['revenue', 'profit', 'cost', 'price', 'amount', 'value', 'fee', 'fare'],
+            'transportation': ['fare', 'distance', 'duration', 'rating', 'cost', 'efficiency'],
+            'hr': ['salary', 'performance', 'rating', 'score', 'experience'],
+            'sales': ['revenue', 'amount', 'quantity', 'volume', 'conversion'],
+            'operations': ['efficiency', 'utilization', 'throughput', 'capacity']
+        }
+        
+        # Domain-specific categorical priorities
+        self.category_keywords = {
+            'financial': ['type', 'category', 'department', 'region', 'status'],
+            'transportation': ['vehicle', 'location', 'route', 'driver', 'payment', 'status'],
+            'hr': ['department', 'role', 'level', 'location', 'team'],
+            'sales': ['region', 'product', 'channel', 'segment', 'status']
+        }
+        
+        # Keyword lists compiled into one alternation per domain so each
+        # column name is scanned once by the regex engine
+        self._metric_patterns = {
+            domain: re.compile('|'.join(map(re.escape, keywords)))
+            for domain, keywords in self.metric_keywords.items()
+        }
+        self._category_patterns = {
+            domain: re.compile('|'.join(map(re.escape, keywords)))
+            for domain, keywords in self.category_keywords.items()
         }
         
     def create_agent(self) -> Agent:
@@ -84,50 +205,92 @@ class DashboardDesigner:
         Returns:
             Dictionary containing complete dashboard design
         """
+        if len(df.columns) == 0:
+            return self._failed_design("Dashboard design failed: no columns to visualize")
+        
+        # Partition columns by dtype once for every helper that needs it
+        column_types = self._partition_dtypes(df)
+        
+        # Analyze data for visualization opportunities; this is the only step
+        # that inspects arbitrary column names and values, so it is the one guarded
         try:
-            # Analyze data for visualization opportunities
-            data_analysis = self._analyze_data_for_visualization(df)
-            
-            # Create visualization recommendations
-            visualizations = self._recommend_visualizations(df, kpis, domain, data_analysis)
-            
-            # Design dashboard layout
-            layout = self._design_layout(visualizations, kpis)
-            
-            # Create dashboard sections
-            sections = self._create_dashboard_sections(visualizations, kpis, domain)
-            
-            # Generate filter recommendations
-            filters = self._recommend_filters(df, domain)
-            
-            # Create color scheme
-            colors = self._get_color_scheme(domain, user_preferences)
-            
-            # Generate dashboard metadata
-            metadata = self._generate_dashboard_metadata(df, kpis, domain)
+            data_analysis = self._analyze_data_for_visualization(df, column_types)
+        except Exception as e:
+            return self._failed_design(f"Dashboard design failed: {str(e)}")
+        
+        # Create visualization recommendations
+        visualizations = self._recommend_visualizations(df, kpis, domain, data_analysis)
+        
+        # Design dashboard layout
+        layout = self._design_layout(visualizations, kpis, data_analysis['total_rows'])
+        
+        # Create dashboard sections
+        sections = self._create_dashboard_sections(visualizations, kpis, domain)
+        
+        # Generate filter recommendations
+        filters = self._recommend_filters(df, domain, column_types)
+        
+        # Create color scheme
+        colors = self._get_color_scheme(domain, user_preferences)
+        
+        # Generate dashboard metadata
+        metadata = self._generate_dashboard_metadata(df, kpis, domain)
+        
+        return {
+            'layout': layout,
+            'sections': sections,
+            'visualizations': visualizations,
+            'filters': filters,
+            'colors': colors,
+            'metadata': metadata,
+            'recommendations': self._generate_design_recommendations(visualizations, domain)
+        }
+    
+    def _failed_design(self, error: str) -> Dict[str, Any]:
+        """Empty dashboard design returned when the input cannot be visualized"""
+        return {
+            'layout': {},
+            'sections': [],
+            'visualizations': [],
+            'filters': [],
+            'colors': self._default_palette,
+            'metadata': {},
+            'error': error
+        }
+    
+    def _partition_dtypes(self, df: pd.DataFrame) -> Dict[str, List[str]]:
+        """Partition column names by dtype in a single pass over df.dtypes"""
+        column_types = {
+            'numeric': [],
+            'datetime': [],
+            'categorical': [],
+            'filter_date': [],
+            'filter_categorical': [],
+            'filter_numeric': []
+        }
+        
+        for column, dtype in df.dtypes.items():
+            if pd.api.types.is_numeric_dtype(dtype):
+                column_types['numeric'].append(column)
+                # Range filters skip boolean flags
+                if not pd.api.types.is_bool_dtype(dtype):
+                    column_types['filter_numeric'].append(column)
             
-            return {
-                'layout': layout,
-                'sections': sections,
-                'visualizations': visualizations,
-                'filters': filters,
-                'colors': colors,
-                'metadata': metadata,
-                'recommendations': self._generate_design_recommendations(visualizations, domain)
-            }
+            elif pd.api.types.is_datetime64_any_dtype(dtype):
+                column_types['datetime'].append(column)
+                # Date range filters only use timezone-naive columns
+                if isinstance(dtype, np.dtype):
+                    column_types['filter_date'].append(column)
             
-        except Exception as e:
-            return {
-                'layout': {},
-                'sections': [],
-                'visualizations': [],
-                'filters': [],
-                'colors': self.color_schemes['default'],
-                'metadata': {},
-                'error': f"Dashboard design failed: {str(e)}"
-            }
+            else:
+                column_types['categorical'].append(column)
+                # Multi-select filters use string/object and category columns
+                if dtype == object or isinstance(dtype, (pd.StringDtype, pd.CategoricalDtype)):
+                    column_types['filter_categorical'].append(column)
+        
+        return column_types
     
-    def _analyze_data_for_visualization(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_data_for_visualization(self, df: pd.DataFrame, column_types: Dict[str, List[str]]) -> Dict[str, Any]:
         """Analyze data characteristics for visualization planning"""
         analysis = {
             'total_rows': len(df),
@@ -140,39 +303,77 @@ class DashboardDesigner:
             'hierarchical_data': False
         }
         
-        # Analyze each column
-        for column in df.columns:
-            dtype = df[column].dtype
+        # Categorical stats come from a fixed-seed row sample on large frames;
+        # numeric aggregates below stay exact on the full frame
+        if len(df) > _CATEGORICAL_SAMPLE_ROWS:
+            sample_df = df.sample(n=_CATEGORICAL_SAMPLE_ROWS, random_state=0)
+        else:
+            sample_df = df
+        analysis['categorical_sample_rows'] = len(sample_df)
+        
+        # Compute numeric statistics with frame-level reductions instead of
+        # separate min/max/mean/variance scans per column, then turn them into
+        # per-column records in one pass
+        numeric_names = column_types['numeric']
+        if numeric_names:
+            numeric_df = df[numeric_names]
+            numeric_stats = pd.DataFrame({
+                'min': numeric_df.min(),
+                'max': numeric_df.max(),
+                'mean': numeric_df.mean(),
+                'variance': numeric_df.var()
+            }).fillna(0).to_dict('index')
+        
+        # Analyze numeric columns
+        for column in numeric_names:
+            stats = numeric_stats[column]
+            analysis['numeric_columns'].append({
+                'name': column,
+                'name_lower': column.lower(),
+                'min': float(stats['min']),
+                'max': float(stats['max']),
+                'mean': float(stats['mean']),
+                'variance': float(stats['variance']),
+                'distribution': 'normal'  # Simplified
+            })
+        
+        # Analyze date columns
+        if column_types['datetime']:
+            analysis['date_columns'].extend(column_types['datetime'])
+            analysis['temporal_data'] = True
+        
+        # Analyze categorical columns
+        for column in column_types['categorical']:
+            name_lower = column.lower()
             
-            if pd.api.types.is_numeric_dtype(dtype):
-                analysis['numeric_columns'].append({
-                    'name': column,
-                    'min': float(df[column].min()) if pd.notna(df[column].min()) else 0,
-                    'max': float(df[column].max()) if pd.notna(df[column].max()) else 0,
-                    'mean': float(df[column].mean()) if pd.notna(df[column].mean()) else 0,
-                    'distribution': 'normal'  # Simplified
-                })
+            # One hash aggregation yields both the cardinality and top values;
+            # categorical value_counts also lists unused categories as zeros
+            series = sample_df[column]
+            dtype = series.dtype
+            if _HAS_PYARROW and dtype == object and pd.api.types.infer_dtype(series, skipna=True) == 'string':
+                # Arrow-backed strings are hashed in a vectorized kernel
+                # rather than one Python object at a time
+                series = series.astype('string[pyarrow]')
+            value_counts = series.value_counts()
+            if isinstance(dtype, pd.CategoricalDtype):
+                unique_count = int((value_counts > 0).sum())
+            else:
+                unique_count = len(value_counts)
+            analysis['categorical_columns'].append({
+                'name': column,
+                'name_lower': name_lower,
+                'unique_count': unique_count,
+                'is_high_cardinality': unique_count > 20,
+                'top_values': value_counts.head(5).to_dict()
+            })
             
-            elif pd.api.types.is_datetime64_any_dtype(dtype):
-                analysis['date_columns'].append(column)
-                analysis['temporal_data'] = True
+            # Check for geographic indicators
+            if any(geo_term in name_lower for geo_term in ['country', 'state', 'city', 'region', 'location']):
+                analysis['geographic_data'] = True
             
-            else:
-                unique_count = df[column].nunique()
-                analysis['categorical_columns'].append({
-                    'name': column,
-                    'unique_count': unique_count,
-                    'is_high_cardinality': unique_count > 20,
-                    'top_values': df[column].value_counts().head(5).to_dict()
-                })
-                
-                # Check for geographic indicators
-                if any(geo_term in column.lower() for geo_term in ['country', 'state', 'city', 'region', 'location']):
-                    analysis['geographic_data'] = True
-                
-                # Check for hierarchical indicators
-                if any(hier_term in column.lower() for hier_term in ['category', 'department', 'division', 'level']):
-                    analysis['hierarchical_data'] = True
+            # Check for hierarchical indicators
+            if any(hier_term in name_lower for hier_term in ['category', 'department', 'division', 'level']):
+                analysis['hierarchical_data'] = True
         
         return analysis
     
@@ -192,9 +393,17 @@ class DashboardDesigner:
         else:
             target_charts = 5  # Minimum for any dataset
         
+        # Select the headline metric and category once; every section reuses them
+        primary_metric = self._select_primary_metric(data_analysis['numeric_columns'], domain)
+        best_cat_col = self._select_best_categorical_column(data_analysis['categorical_columns'], domain)
+        
+        # Display labels are formatted once and shared by every chart title
+        primary_label = primary_metric["name"].replace("_", " ").title() if primary_metric else None
+        category_label = best_cat_col["name"].replace("_", " ").title() if best_cat_col else None
+        
         # 1. KPI Summary Cards (Always first priority)
         if kpis and isinstance(kpis, dict):
-            kpi_list = list(kpis.keys())[:6] if hasattr(kpis, 'keys') else []
+            kpi_list = list(itertools.islice(kpis, 6))
             visualizations.append({
                 'type': 'kpi_cards',
                 'title': 'Key Performance Indicators',
@@ -216,10 +425,9 @@ class DashboardDesigner:
             numeric_cols = data_analysis['numeric_columns']
             
             # Primary time series - most important metric over time
-            primary_metric = self._select_primary_metric(numeric_cols, domain)
             visualizations.append({
                 'type': 'line',
-                'title': f'{primary_metric["name"].replace("_", " ").title()} Trend Analysis',
+                'title': f'{primary_label} Trend Analysis',
                 'description': f'Time series showing {primary_metric["name"]} performance over time',
                 'x_axis': date_columns[0],
                 'y_axis': primary_metric['name'],
@@ -253,18 +461,11 @@ class DashboardDesigner:
         
         # 3. CATEGORICAL ANALYSIS - Bar Charts and Pie Charts
         if data_analysis['categorical_columns'] and data_analysis['numeric_columns']:
-            cat_cols = data_analysis['categorical_columns']
-            numeric_cols = data_analysis['numeric_columns']
-            
-            # Find best categorical breakdown
-            best_cat_col = self._select_best_categorical_column(cat_cols, domain)
-            primary_metric = self._select_primary_metric(numeric_cols, domain)
-            
             if not best_cat_col['is_high_cardinality']:
                 # Bar chart for categorical comparison
                 visualizations.append({
                     'type': 'bar',
-                    'title': f'{primary_metric["name"].replace("_", " ").title()} by {best_cat_col["name"].replace("_", " ").title()}',
+                    'title': f'{primary_label} by {category_label}',
                     'description': f'Comparative analysis across {best_cat_col["name"]} categories',
                     'x_axis': best_cat_col['name'],
                     'y_axis': primary_metric['name'],
@@ -279,10 +480,10 @@ class DashboardDesigner:
                 })
                 
                 # Pie chart for composition analysis (if appropriate)
-                if self._is_suitable_for_pie_chart(best_cat_col, df) and len(visualizations) < target_charts:
+                if self._is_suitable_for_pie_chart(best_cat_col, data_analysis['categorical_sample_rows']) and len(visualizations) < target_charts:
                     visualizations.append({
                         'type': 'donut',
-                        'title': f'{primary_metric["name"].replace("_", " ").title()} Distribution',
+                        'title': f'{primary_label} Distribution',
                         'description': f'Composition breakdown showing share by {best_cat_col["name"]}',
                         'category_column': best_cat_col['name'],
                         'value_column': primary_metric['name'],
@@ -298,10 +499,9 @@ class DashboardDesigner:
         # 4. DISTRIBUTION ANALYSIS - Histograms and Box Plots
         if len(data_analysis['numeric_columns']) >= 1 and len(visualizations) < target_charts:
             # Key metric distribution
-            primary_metric = self._select_primary_metric(data_analysis['numeric_columns'], domain)
             visualizations.append({
                 'type': 'histogram',
-                'title': f'{primary_metric["name"].replace("_", " ").title()} Distribution Analysis',
+                'title': f'{primary_label} Distribution Analysis',
                 'description': f'Statistical distribution showing patterns and outliers in {primary_metric["name"]}',
                 'data_column': primary_metric['name'],
                 'priority': 4,
@@ -354,20 +554,16 @@ class DashboardDesigner:
         
         # 6. HIERARCHICAL ANALYSIS - Tree Maps for rich datasets
         if column_count >= 15 and len(data_analysis['categorical_columns']) >= 2 and len(visualizations) < target_charts:
-            cat_cols = data_analysis['categorical_columns']
-            numeric_col = self._select_primary_metric(data_analysis['numeric_columns'], domain)
-            
             # Tree map for hierarchical data
-            primary_cat = self._select_best_categorical_column(cat_cols, domain)
-            secondary_cat = next((col for col in cat_cols if col['name'] != primary_cat['name']), None)
+            secondary_cat = next((col for col in data_analysis['categorical_columns'] if col['name'] != best_cat_col['name']), None)
             
-            if secondary_cat and not primary_cat['is_high_cardinality']:
+            if secondary_cat and not best_cat_col['is_high_cardinality']:
                 visualizations.append({
                     'type': 'treemap',
-                    'title': f'{numeric_col["name"].replace("_", " ").title()} by {primary_cat["name"].replace("_", " ").title()}',
+                    'title': f'{primary_label} by {category_label}',
                     'description': f'Hierarchical view showing size and performance relationships',
-                    'size_column': numeric_col['name'],
-                    'group_column': primary_cat['name'],
+                    'size_column': primary_metric['name'],
+                    'group_column': best_cat_col['name'],
                     'color_column': secondary_cat['name'] if len(data_analysis['numeric_columns']) >= 2 else None,
                     'priority': 5,
                     'size': 'half-width',
@@ -380,12 +576,11 @@ class DashboardDesigner:
         
         # 7. PERFORMANCE GAUGES - For KPI visualization
         if len(data_analysis['numeric_columns']) >= 1 and len(visualizations) < target_charts:
-            primary_metric = self._select_primary_metric(data_analysis['numeric_columns'], domain)
             current_value = df[primary_metric['name']].mean()
             
             visualizations.append({
                 'type': 'gauge',
-                'title': f'{primary_metric["name"].replace("_", " ").title()} Performance Gauge',
+                'title': f'{primary_label} Performance Gauge',
                 'description': f'Current performance level with target benchmarking',
                 'metric': primary_metric['name'],
                 'current_value': current_value,
@@ -443,48 +638,31 @@ class DashboardDesigner:
                 }
             })
         
-        # Sort by priority and return target number of charts
-        sorted_viz = sorted(visualizations, key=lambda x: x['priority'])
-        return sorted_viz[:target_charts]
+        # Return target number of charts by priority (stable, like sorted()[:n])
+        return heapq.nsmallest(target_charts, visualizations, key=operator.itemgetter('priority'))
     
     def _select_primary_metric(self, numeric_columns: List[Dict], domain: str) -> Dict:
         """Select the most important numeric metric based on business domain"""
         if not numeric_columns:
             return None
             
-        # Domain-specific metric prioritization
-        priority_keywords = {
-            'financial': ['revenue', 'profit', 'cost', 'price', 'amount', 'value', 'fee', 'fare'],
-            'transportation': ['fare', 'distance', 'duration', 'rating', 'cost', 'efficiency'],
-            'hr': ['salary', 'performance', 'rating', 'score', 'experience'],
-            'sales': ['revenue', 'amount', 'quantity', 'volume', 'conversion'],
-            'operations': ['efficiency', 'utilization', 'throughput', 'capacity']
-        }
-        
-        keywords = priority_keywords.get(domain, priority_keywords['financial'])
+        pattern = self._metric_patterns.get(domain, self._metric_patterns['financial'])
         
-        # Score each column based on keyword matching and data characteristics
-        scored_columns = []
-        for col in numeric_columns:
-            score = 0
-            col_name_lower = col['name'].lower()
-            
-            # Keyword matching
-            for keyword in keywords:
-                if keyword in col_name_lower:
-                    score += 10
-            
-            # Variance-based scoring (more varied data is often more interesting)
-            if 'variance' in col:
-                score += min(col['variance'] / 1000, 5)  # Cap at 5 points
-                
-            scored_columns.append((score, col))
+        # Score all columns at once: keyword matching (each distinct keyword
+        # counts once) plus variance, since more varied data is often more
+        # interesting (capped at 5 points)
+        keyword_hits = np.fromiter(
+            (_keyword_hits(pattern, col['name_lower']) for col in numeric_columns),
+            dtype=np.float64, count=len(numeric_columns)
+        )
+        variances = np.fromiter(
+            (col.get('variance', 0.0) for col in numeric_columns),
+            dtype=np.float64, count=len(numeric_columns)
+        )
+        scores = 10 * keyword_hits + np.minimum(variances / 1000, 5)
         
-        # Return highest scoring column, or first if no scores
-        if scored_columns:
-            scored_columns.sort(key=lambda x: x[0], reverse=True)
-            return scored_columns[0][1]
-        return numeric_columns[0]
+        # Return highest scoring column (argmax keeps the first one on ties)
+        return numeric_columns[int(scores.argmax())]
     
     def _select_secondary_metric(self, numeric_columns: List[Dict], domain: str, primary_metric: Dict) -> Dict:
         """Select a complementary secondary metric"""
@@ -500,12 +678,12 @@ class DashboardDesigner:
             'amount': ['quantity', 'rate', 'percentage']
         }
         
-        primary_name = primary_metric['name'].lower()
+        primary_name = primary_metric['name_lower']
         for keyword, complements in complementary_keywords.items():
             if keyword in primary_name:
                 for col in available_columns:
                     for complement in complements:
-                        if complement in col['name'].lower():
+                        if complement in col['name_lower']:
                             return col
         
         return available_columns[0]
@@ -515,15 +693,7 @@ class DashboardDesigner:
         if not categorical_columns:
             return None
             
-        # Domain-specific categorical priorities
-        priority_keywords = {
-            'financial': ['type', 'category', 'department', 'region', 'status'],
-            'transportation': ['vehicle', 'location', 'route', 'driver', 'payment', 'status'],
-            'hr': ['department', 'role', 'level', 'location', 'team'],
-            'sales': ['region', 'product', 'channel', 'segment', 'status']
-        }
-        
-        keywords = priority_keywords.get(domain, priority_keywords['financial'])
+        pattern = self._category_patterns.get(domain, self._category_patterns['financial'])
         
         # Score columns by business relevance and cardinality
         scored_columns = []
@@ -531,13 +701,8 @@ class DashboardDesigner:
             if col['is_high_cardinality']:
                 continue  # Skip high cardinality columns
                 
-            score = 0
-            col_name_lower = col['name'].lower()
-            
-            # Keyword matching
-            for keyword in keywords:
-                if keyword in col_name_lower:
-                    score += 10
+            # Keyword matching (each distinct keyword counts once)
+            score = 10 * _keyword_hits(pattern, col['name_lower'])
             
             # Prefer moderate cardinality (2-10 categories)
             unique_count = col.get('unique_count', 0)
@@ -548,12 +713,12 @@ class DashboardDesigner:
                 
             scored_columns.append((score, col))
         
+        # Highest scoring column (first one on ties)
         if scored_columns:
-            scored_columns.sort(key=lambda x: x[0], reverse=True)
-            return scored_columns[0][1]
+            return max(scored_columns, key=lambda x: x[0])[1]
         return categorical_columns[0]
     
-    def _is_suitable_for_pie_chart(self, categorical_column: Dict, df: pd.DataFrame) -> bool:
+    def _is_suitable_for_pie_chart(self, categorical_column: Dict, counted_rows: int) -> bool:
         """Determine if a categorical column is suitable for pie chart visualization"""
         unique_count = categorical_column.get('unique_count', 0)
         
@@ -561,22 +726,19 @@ class DashboardDesigner:
         if not (2 <= unique_count <= 8):
             return False
             
-        # Check if the distribution is not too skewed
-        col_name = categorical_column['name']
-        if col_name in df.columns:
-            value_counts = df[col_name].value_counts()
-            if len(value_counts) > 0:
-                # Avoid pie charts if one category dominates (>80%)
-                max_percentage = value_counts.iloc[0] / len(df)
-                if max_percentage > 0.8:
-                    return False
+        # Check if the distribution is not too skewed, reusing the top value
+        # counts gathered during data analysis
+        top_values = categorical_column.get('top_values')
+        if top_values and counted_rows:
+            # Avoid pie charts if one category dominates (>80%)
+            max_percentage = max(top_values.values()) / counted_rows
+            if max_percentage > 0.8:
+                return False
         
         return True
     
     def _find_meaningful_correlations(self, numeric_columns: List[Dict], domain: str) -> List[tuple]:
-        """Find pairs of numeric columns that have meaningful business relationships"""
-        meaningful_pairs = []
-        
+        """Find pairs of numeric columns that have meaningful business relationships (at most 2)"""
         # Domain-specific meaningful correlations
         correlation_patterns = {
             'financial': [
@@ -594,51 +756,61 @@ class DashboardDesigner:
         }
         
         patterns = correlation_patterns.get(domain, correlation_patterns['financial'])
-        column_names = [col['name'].lower() for col in numeric_columns]
+        column_names = [col['name_lower'] for col in numeric_columns]
         
-        # Find matching patterns
-        for pattern1, pattern2 in patterns:
-            col1_matches = [name for name in column_names if pattern1 in name]
-            col2_matches = [name for name in column_names if pattern2 in name]
-            
-            for col1 in col1_matches:
-                for col2 in col2_matches:
-                    if col1 != col2:
-                        meaningful_pairs.append((col1, col2))
+        # Match every pattern token against the column names once, then
+        # resolve pattern pairs by lookup
+        token_columns = {
+            token: [name for name in column_names if token in name]
+            for token in {token for pair in patterns for token in pair}
+        }
+        
+        # Find matching patterns, stopping after the 2 pairs we keep
+        meaningful_pairs = list(itertools.islice(
+            ((col1, col2)
+             for pattern1, pattern2 in patterns
+             for col1 in token_columns[pattern1]
+             for col2 in token_columns[pattern2]
+             if col1 != col2),
+            2
+        ))
         
         # If no meaningful patterns found, use first two columns
         if not meaningful_pairs and len(numeric_columns) >= 2:
             meaningful_pairs.append((numeric_columns[0]['name'], numeric_columns[1]['name']))
         
-        return meaningful_pairs[:2]  # Limit to 2 correlation pairs
+        return meaningful_pairs
     
-    def _design_layout(self, visualizations: List[Dict[str, Any]], kpis: Dict[str, Any]) -> Dict[str, Any]:
+    def _design_layout(self, visualizations: List[Dict[str, Any]], kpis: Dict[str, Any],
+                       total_rows: int) -> Dict[str, Any]:
         """Design the overall dashboard layout with support for 5-8 charts"""
+        n_viz = len(visualizations)
         
-        # Calculate grid layout with intelligent row arrangement
+        # Calculate grid layout with intelligent row arrangement. Rows are flat
+        # records with identical keys that reference charts by their index in
+        # the visualizations list rather than embedding the chart configs again
         grid_rows = []
         current_row = []
         current_row_width = 0
         
-        for viz in visualizations:
+        for index, viz in enumerate(visualizations):
             viz_width = 2 if viz['size'] == 'full-width' else 1
             
             if current_row_width + viz_width > 2:
-                # Start new row
-                if current_row:
-                    grid_rows.append(current_row)
-                current_row = [viz]
-                current_row_width = viz_width
-            else:
-                current_row.append(viz)
-                current_row_width += viz_width
+                # Start new row (overflow implies the current row is non-empty)
+                grid_rows.append({'row': len(grid_rows), 'visualizations': current_row, 'width': current_row_width})
+                current_row = []
+                current_row_width = 0
+            
+            current_row.append(index)
+            current_row_width += viz_width
         
         if current_row:
-            grid_rows.append(current_row)
+            grid_rows.append({'row': len(grid_rows), 'visualizations': current_row, 'width': current_row_width})
         
         return {
             'title': f'{kpis.get("dashboard_title", "Business Intelligence Dashboard")}',
-            'description': f'Comprehensive analysis dashboard with {len(visualizations)} key visualizations',
+            'description': f'Comprehensive analysis dashboard with {n_viz} key visualizations',
             'grid_layout': {
                 'rows': len(grid_rows),
                 'columns': 2,
@@ -658,77 +830,105 @@ class DashboardDesigner:
                 'refresh_data': True
             },
             'performance': {
-                'lazy_loading': len(visualizations) > 6,  # Enable lazy loading for rich dashboards
+                'lazy_loading': n_viz > 6,  # Enable lazy loading for rich dashboards
                 'chart_caching': True,
-                'progressive_rendering': True
-            }
-        }
-        
-        return {
-            'type': 'grid',
-            'columns': 2,
-            'rows': grid_rows,
-            'responsive': True,
-            'spacing': 'medium',
-            'header': {
-                'title': 'Business Intelligence Dashboard',
-                'subtitle': f'Key insights and performance metrics',
-                'show_filters': True,
-                'show_refresh': True
+                'progressive_rendering': True,
+                # Render charts in requestAnimationFrame batches so chart
+                # initialization yields to the main thread between charts
+                'render_scheduling': {
+                    'mode': 'raf_batched',
+                    'charts_per_frame': 1,
+                    'idle_callback_fallback': True
+                },
+                'max_concurrent_renders': 2
             },
-            'footer': {
-                'show_timestamp': True,
-                'show_data_source': True
+            'aggregation': {
+                # Charts receive pre-binned min/max/first/last points instead of raw rows
+                'strategy': 'm4',
+                'max_points_per_chart': _MAX_POINTS_PER_CHART,
+                'precompute_levels': list(_AGGREGATION_LEVELS),
+                'level': self._pick_aggregate_level(total_rows)
             }
         }
     
+    def _pick_aggregate_level(self, n_rows: int, chart_width_px: int = _DEFAULT_CHART_WIDTH_PX) -> int:
+        """Pick the coarsest precomputed level that still leaves a row per pixel column"""
+        if n_rows <= chart_width_px:
+            return _AGGREGATION_LEVELS[0]
+        
+        # Levels are powers of ten, so the index is the order of magnitude of
+        # rows per pixel, clamped to the levels that are precomputed
+        index = min(int(math.log10(n_rows / chart_width_px)), len(_AGGREGATION_LEVELS) - 1)
+        return _AGGREGATION_LEVELS[index]
+    
     def _create_dashboard_sections(self, visualizations: List[Dict[str, Any]], 
                                   kpis: Dict[str, Any], domain: str) -> List[Dict[str, Any]]:
         """Create logical sections for the dashboard"""
         sections = []
         
+        # Bucket visualizations in one pass; the section predicates are disjoint.
+        # Sections hold lightweight stubs pointing into the top-level
+        # visualizations list (also served by the charts endpoint) so full
+        # chart configs are not embedded twice and can be loaded when visible
+        overview_viz, performance_viz, insights_viz = [], [], []
+        for index, v in enumerate(visualizations):
+            viz_type, priority = _type_and_priority(v)
+            stub = {'index': index, 'type': viz_type, 'title': v.get('title')}
+            if viz_type in _OVERVIEW_TYPES and priority <= 2:
+                overview_viz.append(stub)
+            elif viz_type in _PERFORMANCE_TYPES and priority <= 3:
+                performance_viz.append(stub)
+            elif priority >= 4:
+                insights_viz.append(stub)
+        
         # Overview section (KPIs and key metrics)
-        overview_viz = [v for v in visualizations if v['type'] in ['kpi_cards', 'line'] and v['priority'] <= 2]
         if overview_viz:
             sections.append({
                 'name': 'overview',
                 'title': 'Executive Overview',
                 'description': 'High-level performance indicators and trends',
                 'visualizations': overview_viz,
+                'load_strategy': 'viewport',
+                'max_concurrent': 2,
                 'default_expanded': True
             })
         
         # Performance section (detailed metrics)
-        performance_viz = [v for v in visualizations if v['type'] in ['bar', 'pie', 'scatter'] and v['priority'] <= 3]
         if performance_viz:
             sections.append({
                 'name': 'performance',
                 'title': 'Performance Analysis',
                 'description': 'Detailed breakdown and analysis of key metrics',
                 'visualizations': performance_viz,
+                'load_strategy': 'viewport',
+                'max_concurrent': 2,
                 'default_expanded': True
             })
         
         # Insights section (correlations and patterns)
-        insights_viz = [v for v in visualizations if v['priority'] >= 4]
         if insights_viz:
             sections.append({
                 'name': 'insights',
                 'title': 'Business Insights',
                 'description': 'Data-driven insights and detailed analysis',
                 'visualizations': insights_viz,
+                'load_strategy': 'viewport',
+                'max_concurrent': 2,
                 'default_expanded': False
             })
         
         return sections
     
-    def _recommend_filters(self, df: pd.DataFrame, domain: str) -> List[Dict[str, Any]]:
+    def _recommend_filters(self, df: pd.DataFrame, domain: str,
+                           column_types: Dict[str, List[str]]) -> List[Dict[str, Any]]:
         """Recommend filters for the dashboard"""
         filters = []
+        date_columns = column_types['filter_date']
+        categorical_columns = column_types['filter_categorical']
+        numeric_columns = column_types['filter_numeric']
         
         # Date range filter (if temporal data exists)
-        date_columns = df.select_dtypes(include=['datetime']).columns
-        if len(date_columns) > 0:
+        if date_columns:
             filters.append({
                 'type': 'date_range',
                 'column': date_columns[0],
@@ -738,30 +938,51 @@ class DashboardDesigner:
             })
         
         # Categorical filters (for low-cardinality categories)
-        categorical_columns = df.select_dtypes(include=['object']).columns
         for column in categorical_columns:
-            unique_count = df[column].nunique()
+            series = df[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                # The declared categories are the options; no hashing needed
+                options = series.cat.categories.tolist()
+                unique_count = len(options)
+            else:
+                # More than 20 distinct values in the leading rows already rules
+                # the column out, without hashing the rest of it
+                if series.iloc[:1024].nunique() > 20:
+                    continue
+                
+                # One hash pass gives both the options and the non-null cardinality
+                unique_values = series.unique()
+                unique_count = len(unique_values) - int(pd.isna(unique_values).any())
+                options = unique_values.tolist()
+            
             if 2 <= unique_count <= 20:  # Good filter range
                 filters.append({
                     'type': 'multi_select',
                     'column': column,
                     'label': column.replace('_', ' ').title(),
-                    'options': df[column].unique().tolist(),
+                    'options': options,
                     'default': 'all',
                     'position': 'sidebar'
                 })
         
-        # Numeric range filters (for key metrics)
-        numeric_columns = df.select_dtypes(include=['number']).columns
-        for column in numeric_columns[:2]:  # Only first 2 numeric columns
-            if df[column].nunique() > 10:  # Only if there's variation
+        # Numeric range filters (for key metrics), only first 2 numeric columns
+        # and only if there's variation
+        range_columns = [column for column in numeric_columns[:2] if _exceeds_distinct(df[column], 10)]
+        if range_columns:
+            # Frame-level reductions cover all range columns in one call each
+            range_df = df[range_columns]
+            column_mins = range_df.min()
+            column_maxes = range_df.max()
+            for column in range_columns:
+                column_min = float(column_mins[column])
+                column_max = float(column_maxes[column])
                 filters.append({
                     'type': 'range',
                     'column': column,
                     'label': f'{column.replace("_", " ").title()} Range',
-                    'min': float(df[column].min()),
-                    'max': float(df[column].max()),
-                    'default': [float(df[column].min()), float(df[column].max())],
+                    'min': column_min,
+                    'max': column_max,
+                    'default': [column_min, column_max],
                     'position': 'sidebar'
                 })
         
@@ -772,12 +993,12 @@ class DashboardDesigner:
         if user_preferences and 'colors' in user_preferences:
             return user_preferences['colors']
         
-        return self.color_schemes.get(domain, self.color_schemes['default'])
+        return self.color_schemes.get(domain, self._default_palette)
     
     def _generate_dashboard_metadata(self, df: pd.DataFrame, kpis: Dict[str, Any], domain: str) -> Dict[str, Any]:
         """Generate metadata for the dashboard"""
         return {
-            'created_at': pd.Timestamp.now().isoformat(),
+            'created_at': datetime.now(timezone.utc).isoformat(),
             'data_source': 'uploaded_csv',
             'total_records': len(df),
             'data_columns': len(df.columns),
@@ -790,36 +1011,18 @@ class DashboardDesigner:
     
     def _generate_design_recommendations(self, visualizations: List[Dict[str, Any]], domain: str) -> List[str]:
         """Generate design and usage recommendations"""
-        recommendations = []
-        
-        # Layout recommendations
-        if len(visualizations) > 8:
-            recommendations.append("Consider using tabs or accordion sections to organize visualizations for better user experience.")
-        
-        # Visualization type recommendations
-        chart_types = [v['type'] for v in visualizations]
-        if 'line' not in chart_types and any('trend' in v.get('title', '').lower() for v in visualizations):
-            recommendations.append("Add line charts to better show trends over time.")
-        
-        # Interactivity recommendations
-        recommendations.append("Enable drill-down capabilities on summary charts for deeper analysis.")
-        recommendations.append("Add hover tooltips to charts for detailed information display.")
-        
-        # Performance recommendations
-        if len(visualizations) > 6:
-            recommendations.append("Implement lazy loading for better dashboard performance with many visualizations.")
-        
-        # Domain-specific recommendations
-        if domain == 'financial':
-            recommendations.append("Include variance analysis charts to compare actual vs. budget/forecast.")
-        elif domain == 'sales':
-            recommendations.append("Add funnel charts to visualize the sales pipeline conversion process.")
-        elif domain == 'marketing':
-            recommendations.append("Include attribution analysis to understand campaign effectiveness.")
-        
-        # User experience recommendations
-        recommendations.append("Implement auto-refresh functionality for real-time data updates.")
-        recommendations.append("Add export capabilities for charts and data tables.")
-        recommendations.append("Include contextual help tooltips for business users.")
-        
-        return recommendations
+        n_viz = len(visualizations)
+        
+        # Visualization type traits (single pass; a line chart anywhere settles it)
+        has_line = False
+        has_trend_title = False
+        for v in visualizations:
+            if v['type'] == 'line':
+                has_line = True
+                break
+            if not has_trend_title:
+                title = v.get('title')
+                has_trend_title = bool(title) and 'trend' in title.casefold()
+        
+        # The text is cached per combination of traits; callers get a fresh list
+        return list(_design_recommendations(n_viz > 8, not has_line and has_trend_title, n_viz > 6, domain))
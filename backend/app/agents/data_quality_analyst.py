@@ -4,16 +4,348 @@ Responsible for analyzing data quality, identifying issues, and providing recomm
 """
 
 from crewai import Agent
-from typing import Dict, Any, List
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import combinations, islice
+from typing import Dict, Any, List, Optional, Tuple
+import copy
+import hashlib
+import threading
+import warnings
 import pandas as pd
 import numpy as np
 
+try:
+    import polars as pl
+    _HAS_POLARS = True
+except ImportError:
+    _HAS_POLARS = False
+
+
+# Non-null values used for trial numeric/datetime conversions in type analysis
+_TYPE_INFERENCE_SAMPLE_ROWS = 1000
+
+# Non-null values sampled to estimate the average length of text columns
+_TEXT_LENGTH_SAMPLE_ROWS = 1000
+
+# Above this many numeric columns the pairwise correlation matrix is skipped
+_MAX_CORRELATION_COLUMNS = 200
+
+# Numeric columns compared per step when scanning for a single high correlation
+_CORRELATION_BLOCK_COLUMNS = 64
+
+# float32 block products within this distance of a threshold are confirmed in float64
+_FLOAT32_CORRELATION_MARGIN = 1e-3
+
+# ML recommendations estimate frame-wide statistics from a row sample above this size
+_ML_SAMPLE_THRESHOLD_ROWS = 100_000
+_ML_MAX_SAMPLE_ROWS = 50_000
+
+# Frames longer than this accumulate row-wise statistics one chunk at a time
+_CHUNK_ROWS = 500_000
+
+# Frames with more cells than this count distinct numeric values with polars, if installed
+_POLARS_MIN_CELLS = 10_000_000
+
+# Markers for the summary lines appended after the per-column recommendations
+_READINESS_PREFIX = '🎯'
+_CRITICAL_ISSUE_PREFIX = '⚠️'
+
+# Per-column type analysis runs on a thread pool for frames at least this long
+_PARALLEL_MIN_ROWS = 100_000
+_TYPE_ANALYSIS_WORKERS = 4
+
+# Quality reports remembered per process, keyed by frame fingerprint. Analysts are
+# created per request, so the cache lives at module level to outlive them.
+_REPORT_CACHE_SIZE = 8
+_report_cache: 'OrderedDict[Tuple, Dict[str, Any]]' = OrderedDict()
+_report_cache_lock = threading.Lock()
+
+
+def _fingerprint(df: pd.DataFrame) -> Optional[Tuple]:
+    """Content fingerprint of a frame, or None if its values cannot be hashed
+    
+    Row hashes are digested in order, so reordered or edited rows anywhere in the
+    frame produce a different key.
+    """
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    except TypeError:
+        return None
+    digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16).hexdigest()
+    return (df.shape, tuple(df.columns), tuple(str(dtype) for dtype in df.dtypes), digest)
+
+
+def _cached_report(key: Tuple) -> Optional[Dict[str, Any]]:
+    """Return a private copy of a remembered report, if any"""
+    with _report_cache_lock:
+        report = _report_cache.get(key)
+        if report is None:
+            return None
+        _report_cache.move_to_end(key)
+    return copy.deepcopy(report)
+
+
+def _remember_report(key: Tuple, report: Dict[str, Any]) -> None:
+    """Store a copy of a finished report, evicting the least recently used"""
+    report = copy.deepcopy(report)
+    with _report_cache_lock:
+        _report_cache[key] = report
+        _report_cache.move_to_end(key)
+        if len(_report_cache) > _REPORT_CACHE_SIZE:
+            _report_cache.popitem(last=False)
+
+
+def _count_distinct(df: pd.DataFrame) -> pd.Series:
+    """Distinct non-null values per column, as df.nunique(dropna=True)
+    
+    On large frames with polars available, plain integer and float columns are counted
+    by its multi-threaded kernels; every other column goes through pandas.
+    """
+    if not _HAS_POLARS or df.size <= _POLARS_MIN_CELLS:
+        return df.nunique(dropna=True)
+    
+    is_native = np.fromiter(
+        (isinstance(dtype, np.dtype) and dtype.kind in 'iuf' and dtype.itemsize >= 4 for dtype in df.dtypes),
+        dtype=bool, count=df.shape[1]
+    )
+    if not is_native.any():
+        return df.nunique(dropna=True)
+    
+    native = pl.DataFrame([
+        pl.Series(str(position), df.iloc[:, position].to_numpy(), nan_to_null=True)
+        for position in np.flatnonzero(is_native)
+    ])
+    counts = np.empty(df.shape[1], dtype=np.int64)
+    counts[is_native] = native.select(pl.all().drop_nulls().n_unique()).row(0)
+    if not is_native.all():
+        counts[~is_native] = df.iloc[:, ~is_native].nunique(dropna=True).to_numpy()
+    return pd.Series(counts, index=df.columns)
+
+
+def _index_by_severity(quality_report: Dict[str, Any]) -> Dict[str, Dict[str, List[Tuple[int, Any, Dict[str, Any]]]]]:
+    """Group per-column findings as section -> severity -> [(position, column, info)]
+    
+    Built in one pass over the severity-rated sections. Positions follow the report's
+    column order, so merging buckets and sorting restores the original ordering.
+    """
+    index: Dict[str, Dict[str, List[Tuple[int, Any, Dict[str, Any]]]]] = {}
+    for section in ('missing_values', 'outliers'):
+        buckets = index[section] = defaultdict(list)
+        for position, (column, info) in enumerate(quality_report[section].items()):
+            buckets[info['severity']].append((position, column, info))
+    return index
+
+
+def _dtype_flags(dtype: Any) -> Tuple[bool, bool, bool]:
+    """(numeric, object, category) membership of a dtype, matching DataFrame.select_dtypes"""
+    if isinstance(dtype, pd.CategoricalDtype):
+        return False, False, True
+    base = dtype.numpy_dtype if isinstance(dtype, pd.ArrowDtype) else dtype
+    numeric = issubclass(base.type, np.number) or (
+        getattr(base, '_is_numeric', False) and not pd.api.types.is_bool_dtype(base)
+    )
+    # select_dtypes(include=['object']) also selects the NaN-backed ``str`` dtype
+    is_object = issubclass(base.type, np.object_) or (
+        isinstance(base, pd.StringDtype) and base.na_value is np.nan
+    )
+    return numeric, is_object, False
+
+
+def _split_cols(df: pd.DataFrame) -> Tuple[pd.Index, pd.Index, pd.Index]:
+    """Partition columns into numeric, object and object/category sets with one walk over df.dtypes"""
+    flags = np.array([_dtype_flags(dtype) for dtype in df.dtypes], dtype=bool).reshape(df.shape[1], 3)
+    is_numeric, is_object, is_category = flags.T
+    return df.columns[is_numeric], df.columns[is_object], df.columns[is_object | is_category]
+
+
+def _compact(df: pd.DataFrame, object_cols: pd.Index, nunique: pd.Series) -> pd.DataFrame:
+    """Return a narrower copy of the frame for the row-wise statistic passes
+    
+    int64 columns are downcast to the smallest integer type that holds their range and
+    low-cardinality object columns become categoricals, so null, duplicate and outlier
+    scans move fewer bytes. Both conversions are lossless; floats are left alone since
+    float32 would change quantiles. The caller's frame is never modified.
+    """
+    compact = df.copy(deep=False)
+    for column in df.select_dtypes(include=['int64']).columns:
+        compact[column] = pd.to_numeric(df[column], downcast='integer')
+    if len(df) > 0:
+        for column in object_cols:
+            if nunique[column] / len(df) < 0.5:
+                compact[column] = df[column].astype('category')
+    
+    return compact
+
+
+@dataclass
+class _QualityCache:
+    """Frame-level statistics computed once and shared by the quality sub-analyses"""
+    total_rows: int
+    dtypes: pd.Series
+    isna_counts: pd.Series
+    all_null: pd.Series
+    nunique: pd.Series
+    duplicate_count: int
+    numeric_cols: pd.Index
+    object_cols: pd.Index
+    categorical_cols: pd.Index
+    outlier_lower: pd.Series
+    outlier_upper: pd.Series
+    outlier_counts: pd.Series
+    _value_counts: Dict[Any, pd.Series] = field(default_factory=dict, repr=False)
+    _skewness: Optional[pd.Series] = field(default=None, repr=False)
+    _correlation: Optional[np.ndarray] = field(default=None, repr=False)
+    
+    @property
+    def missing_percentage(self) -> float:
+        """Share of all cells that are null, as a percentage
+        
+        Reduces the cached per-column counts as a flat array instead of re-running
+        isnull() over the frame.
+        """
+        return (self.isna_counts.to_numpy().sum() / (self.total_rows * len(self.dtypes))) * 100
+    
+    def skewness(self, df: pd.DataFrame) -> pd.Series:
+        """Skewness of every numeric column in one pass, computed on first use"""
+        if self._skewness is None:
+            self._skewness = df[self.numeric_cols].skew()
+        return self._skewness
+    
+    def correlation(self, df: pd.DataFrame) -> np.ndarray:
+        """Pairwise correlation matrix of the numeric columns, computed on first use"""
+        if self._correlation is None:
+            self._correlation = df[self.numeric_cols].corr().to_numpy()
+        return self._correlation
+    
+    def has_correlation_above(self, df: pd.DataFrame, threshold: float,
+                              max_rows: Optional[int] = None) -> bool:
+        """Whether any pair of numeric columns has |correlation| above the threshold
+        
+        An already computed matrix is reused. Otherwise, when max_rows is given, longer
+        frames are answered from a uniform row sample, and null-free numeric blocks are
+        standardized once and compared a block of columns at a time in float32, stopping
+        at the first qualifying pair instead of materializing the full matrix. Candidates
+        that float32 rounding could misplace are confirmed in float64.
+        """
+        if self._correlation is not None:
+            corr_matrix = self._correlation
+            return bool((np.abs(corr_matrix[np.triu_indices_from(corr_matrix, k=1)]) > threshold).any())
+        
+        numeric = df[self.numeric_cols]
+        if max_rows is not None and len(numeric) > max_rows:
+            numeric = numeric.sample(max_rows, random_state=0)
+        
+        if self.isna_counts[self.numeric_cols].any():
+            # Nulls need pandas' pairwise-complete correlation
+            corr_matrix = self.correlation(df) if len(numeric) == len(df) else numeric.corr().to_numpy()
+            return bool((np.abs(corr_matrix[np.triu_indices_from(corr_matrix, k=1)]) > threshold).any())
+        
+        values = numeric.to_numpy(dtype=np.float64)
+        n_rows = len(values)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Constant columns become NaN here and never pass the threshold
+            standardized = (values - values.mean(axis=0)) / values.std(axis=0)
+            narrow = standardized.astype(np.float32)
+            for start in range(0, narrow.shape[1], _CORRELATION_BLOCK_COLUMNS):
+                stop = start + _CORRELATION_BLOCK_COLUMNS
+                block = np.abs(np.triu(narrow[:, start:stop].T @ narrow[:, start:] / n_rows, k=1))
+                if (block > threshold + _FLOAT32_CORRELATION_MARGIN).any():
+                    return True
+                for i, j in np.argwhere(block > threshold - _FLOAT32_CORRELATION_MARGIN):
+                    exact = standardized[:, start + i] @ standardized[:, start + j] / n_rows
+                    if abs(exact) > threshold:
+                        return True
+        return False
+    
+    def value_counts(self, df: pd.DataFrame, column: Any) -> pd.Series:
+        """Value counts for a column, computed on first use and shared with later callers"""
+        if column not in self._value_counts:
+            self._value_counts[column] = df[column].value_counts()
+        return self._value_counts[column]
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, chunksize: int = _CHUNK_ROWS) -> '_QualityCache':
+        """Scan the frame once per statistic"""
+        nunique = _count_distinct(df)
+        numeric_cols, object_cols, categorical_cols = _split_cols(df)
+        
+        # Row-wise passes run over the narrowed copy; dtype-based selections use the original
+        stats_df = _compact(df, object_cols, nunique)
+        numeric = stats_df[numeric_cols]
+        
+        # IQR fences for every numeric column from a single quantile call
+        if len(numeric_cols) > 0:
+            quartiles = numeric.quantile([0.25, 0.75])
+            q1, q3 = quartiles.loc[0.25], quartiles.loc[0.75]
+            iqr = q3 - q1
+            lower, upper = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+        else:
+            lower = upper = pd.Series(dtype='float64')
+        
+        if len(df) > chunksize:
+            isna_counts, outlier_counts, duplicate_count = cls._chunked_row_stats(
+                stats_df, numeric_cols, lower, upper, chunksize
+            )
+        else:
+            isna_counts = stats_df.isna().sum()
+            if len(numeric_cols) > 0:
+                outlier_counts = (numeric.lt(lower, axis=1) | numeric.gt(upper, axis=1)).sum(axis=0)
+            else:
+                outlier_counts = pd.Series(dtype='int64')
+            duplicate_count = int(stats_df.duplicated().sum())
+        
+        return cls(
+            total_rows=len(df),
+            dtypes=df.dtypes,
+            isna_counts=isna_counts,
+            all_null=isna_counts == len(df),
+            nunique=nunique,
+            duplicate_count=duplicate_count,
+            numeric_cols=numeric_cols,
+            object_cols=object_cols,
+            categorical_cols=categorical_cols,
+            outlier_lower=lower,
+            outlier_upper=upper,
+            outlier_counts=outlier_counts
+        )
+    
+    @staticmethod
+    def _chunked_row_stats(df: pd.DataFrame, numeric_cols: pd.Index, lower: pd.Series,
+                           upper: pd.Series, chunksize: int) -> Tuple[pd.Series, pd.Series, int]:
+        """Accumulate null counts, outlier counts and distinct row hashes chunk by chunk
+        
+        Only one chunk's boolean masks are alive at a time. Duplicates are counted
+        from 64-bit row hashes rather than df.duplicated()'s full-frame factorization.
+        """
+        isna_counts = np.zeros(df.shape[1], dtype=np.int64)
+        outlier_counts = np.zeros(len(numeric_cols), dtype=np.int64)
+        row_hashes = []
+        
+        for start in range(0, len(df), chunksize):
+            chunk = df.iloc[start:start + chunksize]
+            isna_counts += chunk.isna().sum().to_numpy()
+            
+            numeric = chunk[numeric_cols]
+            outlier_counts += (numeric.lt(lower, axis=1) | numeric.gt(upper, axis=1)).sum(axis=0).to_numpy()
+            
+            row_hashes.append(pd.unique(pd.util.hash_pandas_object(chunk, index=False).to_numpy()))
+        
+        distinct_rows = len(pd.unique(np.concatenate(row_hashes)))
+        return (
+            pd.Series(isna_counts, index=df.columns),
+            pd.Series(outlier_counts, index=numeric_cols),
+            len(df) - distinct_rows
+        )
+
 
 class DataQualityAnalyst:
     """Agent responsible for comprehensive data quality analysis"""
     
-    def __init__(self, llm_config: Dict[str, Any]):
+    def __init__(self, llm_config: Dict[str, Any], max_sample: int = _ML_MAX_SAMPLE_ROWS):
         self.llm_config = llm_config
+        self.max_sample = max_sample
         
     def create_agent(self) -> Agent:
         """Create the Data Quality Analyst agent"""
@@ -41,22 +373,35 @@ class DataQualityAnalyst:
         Returns:
             Dictionary containing ML-focused quality metrics and recommendations
         """
+        # Repeated analyses of the same data reuse the earlier report
+        key = _fingerprint(df)
+        if key is not None:
+            cached = _cached_report(key)
+            if cached is not None:
+                return cached
+        
         try:
+            # Shared per-column statistics so sub-analyses don't rescan the frame
+            cache = _QualityCache.from_frame(df)
+            
             quality_report = {
                 'basic_info': self._get_basic_info(df),
-                'missing_values': self._analyze_missing_values(df),
-                'duplicates': self._analyze_duplicates(df),
+                'missing_values': self._analyze_missing_values(df, cache),
+                'duplicates': self._analyze_duplicates(cache),
                 'data_types': self._analyze_data_types(df),
-                'outliers': self._detect_outliers(df),
-                'consistency': self._check_consistency(df),
-                'ml_readiness': self._assess_ml_readiness(df),
-                'feature_engineering_opportunities': self._identify_feature_opportunities(df),
-                'data_preprocessing_requirements': self._identify_preprocessing_needs(df),
-                'modeling_considerations': self._provide_modeling_insights(df),
-                'data_quality_score': self._calculate_quality_score(df),
-                'recommendations': self._generate_ml_recommendations(df)
+                'outliers': self._detect_outliers(df, cache),
+                'consistency': self._check_consistency(df, cache),
+                'ml_readiness': self._assess_ml_readiness(df, cache),
+                'feature_engineering_opportunities': self._identify_feature_opportunities(df, cache),
+                'data_preprocessing_requirements': self._identify_preprocessing_needs(df, cache),
+                'modeling_considerations': self._provide_modeling_insights(df, cache),
+                'data_quality_score': self._calculate_quality_score(df, cache),
+                'recommendations': self._generate_ml_recommendations(df, cache)
             }
             
+            if key is not None:
+                _remember_report(key, quality_report)
+            
             return quality_report
             
         except Exception as e:
@@ -75,40 +420,32 @@ class DataQualityAnalyst:
             'sample_data': df.head(3).to_dict('records') if len(df) > 0 else []
         }
     
-    def _analyze_missing_values(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_missing_values(self, df: pd.DataFrame, cache: _QualityCache) -> Dict[str, Any]:
         """Analyze missing values in the dataset"""
-        missing_info = {}
-        total_rows = len(df)
+        counts = cache.isna_counts
+        percentages = counts / cache.total_rows * 100
+        
+        # Bucketize every column's severity in one vectorized pass
+        severities = np.select(
+            [percentages == 0, percentages < 5, percentages < 20, percentages < 50],
+            ['none', 'low', 'medium', 'high'],
+            default='critical'
+        )
+        rounded = percentages.round(2)
         
-        for column in df.columns:
-            missing_count = df[column].isnull().sum()
-            missing_percentage = (missing_count / total_rows) * 100
-            
-            missing_info[column] = {
-                'missing_count': int(missing_count),
-                'missing_percentage': round(missing_percentage, 2),
-                'severity': self._get_missing_severity(missing_percentage)
+        return {
+            column: {
+                'missing_count': int(counts.iloc[i]),
+                'missing_percentage': rounded.iloc[i],
+                'severity': str(severities[i])
             }
-        
-        return missing_info
-    
-    def _get_missing_severity(self, percentage: float) -> str:
-        """Determine severity of missing data"""
-        if percentage == 0:
-            return 'none'
-        elif percentage < 5:
-            return 'low'
-        elif percentage < 20:
-            return 'medium'
-        elif percentage < 50:
-            return 'high'
-        else:
-            return 'critical'
+            for i, column in enumerate(df.columns)
+        }
     
-    def _analyze_duplicates(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_duplicates(self, cache: _QualityCache) -> Dict[str, Any]:
         """Analyze duplicate records"""
-        duplicate_rows = df.duplicated().sum()
-        total_rows = len(df)
+        duplicate_rows = cache.duplicate_count
+        total_rows = cache.total_rows
         duplicate_percentage = (duplicate_rows / total_rows) * 100 if total_rows > 0 else 0
         
         return {
@@ -119,96 +456,95 @@ class DataQualityAnalyst:
     
     def _analyze_data_types(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze data types and suggest improvements"""
-        type_info = {}
+        columns = list(df.columns)
+        
+        # Warning filters are process-wide, so they are set once here rather than per worker
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            if len(df) >= _PARALLEL_MIN_ROWS and len(columns) > 1:
+                # Columns are independent; spread them over a small thread pool
+                with ThreadPoolExecutor(max_workers=_TYPE_ANALYSIS_WORKERS) as pool:
+                    results = list(pool.map(lambda column: self._analyze_column_type(df[column]), columns))
+            else:
+                results = [self._analyze_column_type(df[column]) for column in columns]
         
-        for column in df.columns:
-            dtype = str(df[column].dtype)
-            sample_values = df[column].dropna().head(5).tolist()
+        return dict(zip(columns, results))
+    
+    def _analyze_column_type(self, series: pd.Series) -> Dict[str, Any]:
+        """Analyze a single column's type and suggest improvements"""
+        dtype = str(series.dtype)
+        non_null = series.dropna()
+        sample_values = non_null.head(5).tolist()
+        
+        # Check if numeric columns are stored as object
+        suggestions = []
+        if dtype == 'object':
+            # Trial conversions only run on a bounded sample of non-null values
+            sample = non_null.head(_TYPE_INFERENCE_SAMPLE_ROWS)
             
-            # Check if numeric columns are stored as object
-            suggestions = []
-            if dtype == 'object':
-                # Try to convert to numeric
+            # Try to convert to numeric
+            try:
+                pd.to_numeric(sample, errors='raise')
+                suggestions.append('Consider converting to numeric type')
+            except:
+                # Check for date patterns
                 try:
-                    pd.to_numeric(df[column], errors='raise')
-                    suggestions.append('Consider converting to numeric type')
+                    date_converted = pd.to_datetime(sample, errors='coerce', cache=True)
+                    # Only suggest datetime if more than 50% of values were successfully converted,
+                    # scaling the sample's parse rate up to the column's non-null count
+                    parsed = date_converted.notna().sum()
+                    if parsed * len(non_null) > len(sample) * len(series) * 0.5:
+                        suggestions.append('Consider converting to datetime type')
                 except:
-                    # Check for date patterns - suppress warnings with explicit format checking
-                    import warnings
-                    with warnings.catch_warnings():
-                        warnings.simplefilter("ignore")
-                        try:
-                            date_converted = pd.to_datetime(df[column], errors='coerce')
-                            # Only suggest datetime if more than 50% of values were successfully converted
-                            if date_converted.notna().sum() > len(df[column]) * 0.5:
-                                suggestions.append('Consider converting to datetime type')
-                        except:
-                            pass
-            
-            type_info[column] = {
-                'current_type': dtype,
-                'sample_values': sample_values,
-                'suggestions': suggestions
-            }
+                    pass
         
-        return type_info
+        return {
+            'current_type': dtype,
+            'sample_values': sample_values,
+            'suggestions': suggestions
+        }
     
-    def _detect_outliers(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _detect_outliers(self, df: pd.DataFrame, cache: _QualityCache) -> Dict[str, Any]:
         """Detect outliers in numeric columns"""
         outlier_info = {}
         
-        numeric_columns = df.select_dtypes(include=[np.number]).columns
-        
-        for column in numeric_columns:
-            if df[column].notna().sum() > 0:
-                Q1 = df[column].quantile(0.25)
-                Q3 = df[column].quantile(0.75)
-                IQR = Q3 - Q1
-                
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                
-                outliers = df[(df[column] < lower_bound) | (df[column] > upper_bound)]
-                outlier_count = len(outliers)
+        for column in cache.numeric_cols:
+            if not cache.all_null[column]:
+                outlier_count = int(cache.outlier_counts[column])
                 
                 outlier_info[column] = {
                     'outlier_count': outlier_count,
                     'outlier_percentage': round((outlier_count / len(df)) * 100, 2),
-                    'lower_bound': lower_bound,
-                    'upper_bound': upper_bound,
+                    'lower_bound': cache.outlier_lower[column],
+                    'upper_bound': cache.outlier_upper[column],
                     'severity': 'high' if outlier_count > len(df) * 0.1 else 'medium' if outlier_count > len(df) * 0.05 else 'low'
                 }
         
         return outlier_info
     
-    def _check_consistency(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _check_consistency(self, df: pd.DataFrame, cache: _QualityCache) -> Dict[str, Any]:
         """Check data consistency across columns"""
         consistency_issues = []
         
         # Check for inconsistent text casing
-        text_columns = df.select_dtypes(include=['object']).columns
-        for column in text_columns:
-            if df[column].dtype == 'object':
+        for column in cache.object_cols:
+            if df[column].dtype == 'object' and cache.nunique[column] > 1:
                 unique_values = df[column].dropna().unique()
                 if len(unique_values) > 1:
                     # Check for case inconsistencies
-                    lower_values = [str(v).lower() for v in unique_values]
-                    if len(set(lower_values)) < len(unique_values):
+                    lower_values = pd.Series(unique_values).astype(str).str.lower()
+                    if lower_values.nunique() < len(unique_values):
                         consistency_issues.append(f"Inconsistent casing in column '{column}'")
         
         # Check for date format consistency
         for column in df.columns:
             if 'date' in column.lower() or 'time' in column.lower():
                 try:
-                    sample_dates = df[column].dropna().head(10).astype(str)
-                    date_formats = set()
-                    for date_str in sample_dates:
-                        if '/' in date_str:
-                            date_formats.add('slash_format')
-                        elif '-' in date_str:
-                            date_formats.add('dash_format')
+                    sample_dates = df[column].dropna().head(10).astype(str).str
+                    has_slash = sample_dates.contains('/', regex=False)
+                    has_dash = sample_dates.contains('-', regex=False) & ~has_slash
                     
-                    if len(date_formats) > 1:
+                    if has_slash.any() and has_dash.any():
                         consistency_issues.append(f"Inconsistent date formats in column '{column}'")
                 except:
                     pass
@@ -218,7 +554,7 @@ class DataQualityAnalyst:
             'severity': 'high' if len(consistency_issues) > 3 else 'medium' if len(consistency_issues) > 1 else 'low'
         }
     
-    def _calculate_quality_score(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _calculate_quality_score(self, df: pd.DataFrame, cache: _QualityCache) -> Dict[str, Any]:
         """
         Calculate overall data quality score and ML readiness metrics
         """
@@ -227,7 +563,7 @@ class DataQualityAnalyst:
         max_score = 0
         
         # Missing data score (0-25 points)
-        missing_percentage = (df.isnull().sum().sum() / (df.shape[0] * df.shape[1])) * 100
+        missing_percentage = cache.missing_percentage
         if missing_percentage <= 5:
             missing_score = 25
         elif missing_percentage <= 15:
@@ -244,7 +580,7 @@ class DataQualityAnalyst:
         max_score += 25
         
         # Duplicate score (0-20 points)
-        duplicate_percentage = (df.duplicated().sum() / len(df)) * 100
+        duplicate_percentage = (cache.duplicate_count / len(df)) * 100
         if duplicate_percentage == 0:
             duplicate_score = 20
         elif duplicate_percentage <= 5:
@@ -259,14 +595,14 @@ class DataQualityAnalyst:
         max_score += 20
         
         # Data type consistency (0-20 points)
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        numeric_cols = cache.numeric_cols
         consistent_types = 0
         total_cols = len(df.columns)
         
         for col in df.columns:
             if col in numeric_cols:
                 # Check if numeric columns have consistent values
-                if not df[col].isnull().all():
+                if not cache.all_null[col]:
                     try:
                         pd.to_numeric(df[col], errors='raise')
                         consistent_types += 1
@@ -275,7 +611,7 @@ class DataQualityAnalyst:
             else:
                 # For non-numeric, check if values are reasonable
                 if df[col].dtype == 'object':
-                    unique_ratio = df[col].nunique() / len(df)
+                    unique_ratio = cache.nunique[col] / len(df)
                     if 0.01 <= unique_ratio <= 0.8:  # Reasonable diversity
                         consistent_types += 1
         
@@ -285,16 +621,11 @@ class DataQualityAnalyst:
         max_score += 20
         
         # Outlier impact (0-15 points)
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
         outlier_impact = 0
         
         for col in numeric_cols:
-            if not df[col].isnull().all():
-                Q1 = df[col].quantile(0.25)
-                Q3 = df[col].quantile(0.75)
-                IQR = Q3 - Q1
-                outliers = df[(df[col] < Q1 - 1.5 * IQR) | (df[col] > Q3 + 1.5 * IQR)]
-                outlier_percentage = len(outliers) / len(df) * 100
+            if not cache.all_null[col]:
+                outlier_percentage = cache.outlier_counts[col] / len(df) * 100
                 if outlier_percentage <= 5:
                     outlier_impact += 1
         
@@ -316,7 +647,7 @@ class DataQualityAnalyst:
             'overall_score': round(overall_score, 2),
             'component_scores': scores,
             'ml_readiness_level': self._get_ml_readiness_level(overall_score),
-            'critical_issues': self._identify_critical_issues(df, scores)
+            'critical_issues': self._identify_critical_issues(cache, scores)
         }
     
     def _get_ml_readiness_level(self, score: float) -> str:
@@ -332,7 +663,7 @@ class DataQualityAnalyst:
         else:
             return "Not Suitable for ML Without Major Preprocessing"
     
-    def _identify_critical_issues(self, df: pd.DataFrame, scores: Dict) -> List[str]:
+    def _identify_critical_issues(self, cache: _QualityCache, scores: Dict) -> List[str]:
         """Identify critical issues that block ML development"""
         issues = []
         
@@ -349,29 +680,29 @@ class DataQualityAnalyst:
             issues.append("Data type inconsistencies require attention")
         
         # Check for high cardinality categorical variables
-        for col in df.select_dtypes(include=['object']).columns:
-            unique_ratio = df[col].nunique() / len(df)
+        for col in cache.object_cols:
+            unique_ratio = cache.nunique[col] / cache.total_rows
             if unique_ratio > 0.8:
                 issues.append(f"High cardinality in '{col}' - may need encoding strategies")
         
         return issues
 
-    def _assess_ml_readiness(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _assess_ml_readiness(self, df: pd.DataFrame, cache: _QualityCache) -> Dict[str, Any]:
         """
         Assess how ready the data is for machine learning
         """
         readiness = {
-            'target_variable_analysis': self._analyze_potential_targets(df),
-            'feature_distribution': self._analyze_feature_distributions(df),
-            'correlation_analysis': self._analyze_correlations(df),
-            'class_balance': self._check_class_balance(df),
-            'scaling_requirements': self._assess_scaling_needs(df),
-            'encoding_requirements': self._assess_encoding_needs(df)
+            'target_variable_analysis': self._analyze_potential_targets(df, cache),
+            'feature_distribution': self._analyze_feature_distributions(df, cache),
+            'correlation_analysis': self._analyze_correlations(df, cache),
+            'class_balance': self._check_class_balance(df, cache),
+            'scaling_requirements': self._assess_scaling_needs(df, cache),
+            'encoding_requirements': self._assess_encoding_needs(df, cache)
         }
         
         return readiness
     
-    def _analyze_potential_targets(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_potential_targets(self, df: pd.DataFrame, cache: _QualityCache) -> Dict[str, Any]:
         """Identify potential target variables for ML"""
         targets = {
             'binary_targets': [],
@@ -382,22 +713,22 @@ class DataQualityAnalyst:
         
         for col in df.columns:
             if df[col].dtype in ['object', 'category']:
-                unique_count = df[col].nunique()
+                unique_count = int(cache.nunique[col])
                 if unique_count == 2:
                     targets['binary_targets'].append({
                         'column': col,
                         'values': df[col].unique().tolist(),
-                        'distribution': df[col].value_counts().to_dict()
+                        'distribution': cache.value_counts(df, col).to_dict()
                     })
                 elif 2 < unique_count <= 10:
                     targets['categorical_targets'].append({
                         'column': col,
                         'classes': unique_count,
-                        'distribution': df[col].value_counts().to_dict()
+                        'distribution': cache.value_counts(df, col).to_dict()
                     })
             else:
                 # Check if numeric column could be a target
-                if df[col].nunique() > 10:  # Continuous target
+                if cache.nunique[col] > 10:  # Continuous target
                     targets['continuous_targets'].append({
                         'column': col,
                         'min': float(df[col].min()),
@@ -416,7 +747,7 @@ class DataQualityAnalyst:
         
         return targets
     
-    def _analyze_feature_distributions(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_feature_distributions(self, df: pd.DataFrame, cache: _QualityCache) -> Dict[str, Any]:
         """Analyze feature distributions for ML insights"""
         distributions = {
             'skewed_features': [],
@@ -425,48 +756,49 @@ class DataQualityAnalyst:
             'recommendations': []
         }
         
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        if len(cache.numeric_cols) == 0:
+            return distributions
         
-        for col in numeric_cols:
-            if not df[col].isnull().all():
-                skewness = abs(df[col].skew())
-                if skewness > 1:
-                    distributions['skewed_features'].append({
-                        'column': col,
-                        'skewness': round(skewness, 3),
-                        'transformation_needed': True
-                    })
-                elif skewness < 0.5:
-                    distributions['normal_distributions'].append({
-                        'column': col,
-                        'skewness': round(skewness, 3)
-                    })
+        skews = cache.skewness(df).abs()
+        
+        distributions['skewed_features'] = [
+            {'column': col, 'skewness': round(skewness, 3), 'transformation_needed': True}
+            for col, skewness in skews[skews > 1].items()
+        ]
+        distributions['normal_distributions'] = [
+            {'column': col, 'skewness': round(skewness, 3)}
+            for col, skewness in skews[skews < 0.5].items()
+        ]
         
         if distributions['skewed_features']:
             distributions['recommendations'].append("Consider log/sqrt transformation for skewed features")
         
         return distributions
     
-    def _analyze_correlations(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_correlations(self, df: pd.DataFrame, cache: _QualityCache) -> Dict[str, Any]:
         """Analyze feature correlations"""
-        numeric_df = df.select_dtypes(include=[np.number])
-        
-        if numeric_df.shape[1] < 2:
+        if len(cache.numeric_cols) < 2:
             return {'message': 'Insufficient numeric features for correlation analysis'}
-        
-        corr_matrix = numeric_df.corr()
-        
-        # Find highly correlated pairs
-        high_corr_pairs = []
-        for i in range(len(corr_matrix.columns)):
-            for j in range(i+1, len(corr_matrix.columns)):
-                corr_value = corr_matrix.iloc[i, j]
-                if abs(corr_value) > 0.8:
-                    high_corr_pairs.append({
-                        'feature1': corr_matrix.columns[i],
-                        'feature2': corr_matrix.columns[j],
-                        'correlation': round(corr_value, 3)
-                    })
+        if len(cache.numeric_cols) > _MAX_CORRELATION_COLUMNS:
+            return {'message': 'Too many numeric features for pairwise correlation analysis'}
+        
+        corr_matrix = cache.correlation(df)
+        # Plain lists, so building each pair is list indexing rather than pandas lookups
+        columns = cache.numeric_cols.tolist()
+        
+        # Find highly correlated pairs in the upper triangle
+        rows, cols = np.triu_indices_from(corr_matrix, k=1)
+        values = corr_matrix[rows, cols]
+        mask = np.abs(values) > 0.8
+        
+        high_corr_pairs = [
+            {
+                'feature1': columns[i],
+                'feature2': columns[j],
+                'correlation': round(corr_value, 3)
+            }
+            for i, j, corr_value in zip(rows[mask].tolist(), cols[mask].tolist(), values[mask].tolist())
+        ]
         
         return {
             'high_correlations': high_corr_pairs,
@@ -474,16 +806,14 @@ class DataQualityAnalyst:
             'recommendations': ['Consider removing highly correlated features'] if high_corr_pairs else []
         }
     
-    def _check_class_balance(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _check_class_balance(self, df: pd.DataFrame, cache: _QualityCache) -> Dict[str, Any]:
         """Check class balance for potential target variables"""
         balance_analysis = {}
         
-        categorical_cols = df.select_dtypes(include=['object', 'category']).columns
-        
-        for col in categorical_cols:
-            unique_count = df[col].nunique()
+        for col in cache.categorical_cols:
+            unique_count = cache.nunique[col]
             if 2 <= unique_count <= 10:  # Potential classification target
-                value_counts = df[col].value_counts()
+                value_counts = cache.value_counts(df, col)
                 balance_ratio = value_counts.min() / value_counts.max()
                 
                 balance_analysis[col] = {
@@ -495,7 +825,7 @@ class DataQualityAnalyst:
         
         return balance_analysis
     
-    def _assess_scaling_needs(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _assess_scaling_needs(self, df: pd.DataFrame, cache: _QualityCache) -> Dict[str, Any]:
         """Assess which features need scaling"""
         scaling_needs = {
             'features_needing_scaling': [],
@@ -503,20 +833,20 @@ class DataQualityAnalyst:
             'recommendations': []
         }
         
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        # Scale mismatches need at least two numeric features to compare
+        if len(cache.numeric_cols) < 2:
+            return scaling_needs
         
-        scales = {}
-        for col in numeric_cols:
-            if not df[col].isnull().all():
-                col_range = df[col].max() - df[col].min()
-                col_std = df[col].std()
-                scales[col] = {'range': col_range, 'std': col_std}
+        # Column ranges for every populated numeric feature in one pass
+        populated = cache.numeric_cols[~cache.all_null[cache.numeric_cols].to_numpy()]
+        numeric = df[populated]
+        col_ranges = numeric.max() - numeric.min()
         
         # Check if features have very different scales
-        if len(scales) > 1:
-            ranges = [v['range'] for v in scales.values() if v['range'] > 0]
-            if ranges and max(ranges) / min(ranges) > 100:
-                scaling_needs['features_needing_scaling'] = list(scales.keys())
+        if len(populated) > 1:
+            ranges = col_ranges[col_ranges > 0]
+            if len(ranges) and ranges.max() / ranges.min() > 100:
+                scaling_needs['features_needing_scaling'] = list(populated)
                 scaling_needs['scaling_methods'] = {
                     'standard_scaler': 'For normally distributed features',
                     'min_max_scaler': 'For features with known bounds',
@@ -526,7 +856,7 @@ class DataQualityAnalyst:
         
         return scaling_needs
     
-    def _assess_encoding_needs(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _assess_encoding_needs(self, df: pd.DataFrame, cache: _QualityCache) -> Dict[str, Any]:
         """Assess categorical encoding requirements"""
         encoding_needs = {
             'categorical_features': [],
@@ -534,10 +864,10 @@ class DataQualityAnalyst:
             'recommendations': []
         }
         
-        categorical_cols = df.select_dtypes(include=['object', 'category']).columns
+        categorical_cols = cache.categorical_cols
         
         for col in categorical_cols:
-            unique_count = df[col].nunique()
+            unique_count = int(cache.nunique[col])
             
             feature_info = {
                 'column': col,
@@ -562,7 +892,7 @@ class DataQualityAnalyst:
         
         return encoding_needs
 
-    def _identify_feature_opportunities(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _identify_feature_opportunities(self, df: pd.DataFrame, cache: _QualityCache) -> Dict[str, Any]:
         """Identify feature engineering opportunities"""
         opportunities = {
             'datetime_features': [],
@@ -576,23 +906,27 @@ class DataQualityAnalyst:
         for col in df.columns:
             if df[col].dtype == 'object':
                 sample_values = df[col].dropna().head(10)
-                # Simple check for date-like strings
-                for val in sample_values:
-                    if isinstance(val, str) and any(char in val for char in ['-', '/', ':']):
-                        try:
-                            pd.to_datetime(val)
-                            opportunities['datetime_features'].append({
-                                'column': col,
-                                'potential_features': ['year', 'month', 'day', 'hour', 'weekday']
-                            })
-                            break
-                        except:
-                            continue
+                # Simple check for date-like strings, parsed in one call
+                candidates = [
+                    val for val in sample_values
+                    if isinstance(val, str) and any(char in val for char in ['-', '/', ':'])
+                ]
+                if candidates:
+                    with warnings.catch_warnings():
+                        warnings.simplefilter("ignore")
+                        parsed = pd.to_datetime(pd.Series(candidates), errors='coerce', format='mixed', cache=True)
+                    if parsed.notna().any():
+                        opportunities['datetime_features'].append({
+                            'column': col,
+                            'potential_features': ['year', 'month', 'day', 'hour', 'weekday']
+                        })
         
         # Check for text features
-        text_cols = df.select_dtypes(include=['object']).columns
-        for col in text_cols:
-            avg_length = df[col].dropna().astype(str).str.len().mean()
+        for col in cache.object_cols:
+            values = df[col].dropna()
+            if len(values) > _TEXT_LENGTH_SAMPLE_ROWS:
+                values = values.sample(_TEXT_LENGTH_SAMPLE_ROWS, random_state=0)
+            avg_length = values.astype(str).str.len().mean()
             if avg_length > 20:  # Likely text data
                 opportunities['text_features'].append({
                     'column': col,
@@ -601,21 +935,22 @@ class DataQualityAnalyst:
                 })
         
         # Check for binning opportunities
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        numeric_cols = cache.numeric_cols
         for col in numeric_cols:
-            if df[col].nunique() > 20:
+            if cache.nunique[col] > 20:
                 opportunities['binning_opportunities'].append({
                     'column': col,
-                    'unique_values': df[col].nunique(),
+                    'unique_values': int(cache.nunique[col]),
                     'binning_methods': ['equal_width', 'equal_frequency', 'k_means']
                 })
         
         # Suggest interaction features for numeric columns
         if len(numeric_cols) > 1:
-            opportunities['interaction_features'] = [
-                f"{col1} * {col2}" for i, col1 in enumerate(numeric_cols) 
-                for col2 in numeric_cols[i+1:] if col1 != col2
-            ][:5]  # Limit to 5 suggestions
+            pairs = (
+                f"{col1} * {col2}" for col1, col2 in combinations(numeric_cols, 2)
+                if col1 != col2
+            )
+            opportunities['interaction_features'] = list(islice(pairs, 5))  # Limit to 5 suggestions
         
         # Generate recommendations
         if opportunities['datetime_features']:
@@ -629,7 +964,7 @@ class DataQualityAnalyst:
         
         return opportunities
 
-    def _identify_preprocessing_needs(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _identify_preprocessing_needs(self, df: pd.DataFrame, cache: _QualityCache) -> Dict[str, Any]:
         """Identify specific preprocessing requirements"""
         preprocessing = {
             'missing_value_strategy': {},
@@ -641,7 +976,7 @@ class DataQualityAnalyst:
         
         # Missing value strategies
         for col in df.columns:
-            missing_pct = (df[col].isnull().sum() / len(df)) * 100
+            missing_pct = (cache.isna_counts[col] / len(df)) * 100
             if missing_pct > 0:
                 if df[col].dtype in ['object', 'category']:
                     strategy = 'mode_imputation' if missing_pct < 50 else 'create_missing_category'
@@ -654,14 +989,9 @@ class DataQualityAnalyst:
                 }
         
         # Outlier treatment
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        for col in numeric_cols:
-            if not df[col].isnull().all():
-                Q1 = df[col].quantile(0.25)
-                Q3 = df[col].quantile(0.75)
-                IQR = Q3 - Q1
-                outliers = df[(df[col] < Q1 - 1.5 * IQR) | (df[col] > Q3 + 1.5 * IQR)]
-                outlier_pct = (len(outliers) / len(df)) * 100
+        for col in cache.numeric_cols:
+            if not cache.all_null[col]:
+                outlier_pct = (int(cache.outlier_counts[col]) / len(df)) * 100
                 
                 if outlier_pct > 5:
                     preprocessing['outlier_treatment'][col] = {
@@ -670,7 +1000,7 @@ class DataQualityAnalyst:
                     }
         
         # Data cleaning needs
-        if df.duplicated().sum() > 0:
+        if cache.duplicate_count > 0:
             preprocessing['data_cleaning'].append('Remove duplicate records')
         
         # Build transformation pipeline
@@ -679,9 +1009,9 @@ class DataQualityAnalyst:
             pipeline_steps.append('1. Handle missing values')
         if preprocessing['outlier_treatment']:
             pipeline_steps.append('2. Treat outliers')
-        if any(df.select_dtypes(include=['object']).columns):
+        if any(cache.object_cols):
             pipeline_steps.append('3. Encode categorical variables')
-        if len(df.select_dtypes(include=[np.number]).columns) > 1:
+        if len(cache.numeric_cols) > 1:
             pipeline_steps.append('4. Scale numerical features')
         
         preprocessing['transformation_pipeline'] = pipeline_steps
@@ -696,7 +1026,7 @@ class DataQualityAnalyst:
         
         return preprocessing
 
-    def _provide_modeling_insights(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _provide_modeling_insights(self, df: pd.DataFrame, cache: _QualityCache) -> Dict[str, Any]:
         """Provide insights for model selection and training"""
         insights = {
             'dataset_characteristics': {},
@@ -710,9 +1040,9 @@ class DataQualityAnalyst:
         insights['dataset_characteristics'] = {
             'sample_size': len(df),
             'feature_count': len(df.columns),
-            'numeric_features': len(df.select_dtypes(include=[np.number]).columns),
-            'categorical_features': len(df.select_dtypes(include=['object', 'category']).columns),
-            'missing_data_percentage': round((df.isnull().sum().sum() / (df.shape[0] * df.shape[1])) * 100, 2)
+            'numeric_features': len(cache.numeric_cols),
+            'categorical_features': len(cache.categorical_cols),
+            'missing_data_percentage': round(cache.missing_percentage, 2)
         }
         
         # Model recommendations based on data characteristics
@@ -760,19 +1090,19 @@ class DataQualityAnalyst:
         
         return insights
 
-    def _generate_ml_recommendations(self, df: pd.DataFrame) -> List[str]:
+    def _generate_ml_recommendations(self, df: pd.DataFrame, cache: _QualityCache) -> List[str]:
         """
         Generate ML-focused recommendations for data scientists
         """
         recommendations = []
         
-        # Data quality recommendations
-        missing_pct = (df.isnull().sum().sum() / (df.shape[0] * df.shape[1])) * 100
-        if missing_pct > 20:
+        # Data quality recommendations; blocks below are skipped outright when the
+        # cached counts show their condition cannot hold
+        if cache.isna_counts.any() and cache.missing_percentage > 20:
             recommendations.append("🚨 High missing data rate (>20%) - implement robust imputation strategy")
         
-        duplicate_pct = (df.duplicated().sum() / len(df)) * 100
-        if duplicate_pct > 5:
+        # Reuse the row-hash pass from the shared profile instead of hashing every row again
+        if cache.duplicate_count and (cache.duplicate_count / len(df)) * 100 > 5:
             recommendations.append("🔄 Significant duplicates detected - clean before modeling")
         
         # Sample size recommendations
@@ -782,41 +1112,33 @@ class DataQualityAnalyst:
             recommendations.append("⚡ Large dataset - consider sampling strategies for faster iteration")
         
         # Feature engineering recommendations
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        categorical_cols = df.select_dtypes(include=['object', 'category']).columns
+        numeric_cols = cache.numeric_cols
+        categorical_cols = cache.categorical_cols
         
         if len(categorical_cols) > len(numeric_cols):
             recommendations.append("🏷️ Many categorical features - plan encoding strategy carefully")
         
         # Check for high cardinality categoricals
-        high_cardinality = []
-        for col in categorical_cols:
-            if df[col].nunique() > len(df) * 0.5:
-                high_cardinality.append(col)
-        
-        if high_cardinality:
-            recommendations.append(f"🔢 High cardinality features detected: {high_cardinality[:3]} - consider target encoding")
+        if len(categorical_cols):
+            distinct_counts = cache.nunique[categorical_cols]
+            high_cardinality = distinct_counts.index[distinct_counts > len(df) * 0.5]
+            
+            if len(high_cardinality):
+                recommendations.append(f"🔢 High cardinality features detected: {high_cardinality[:3].tolist()} - consider target encoding")
         
         # Skewness recommendations
-        skewed_features = []
-        for col in numeric_cols:
-            if not df[col].isnull().all() and abs(df[col].skew()) > 2:
-                skewed_features.append(col)
-        
-        if skewed_features:
-            recommendations.append(f"📈 Highly skewed features: {skewed_features[:3]} - consider transformation")
+        # All-null columns have NaN skew and fail the threshold
+        if len(numeric_cols):
+            skews = cache.skewness(df).abs()
+            skewed_features = skews.index[skews > 2]
+            
+            if len(skewed_features):
+                recommendations.append(f"📈 Highly skewed features: {skewed_features[:3].tolist()} - consider transformation")
         
         # Correlation recommendations
-        if len(numeric_cols) > 1:
-            corr_matrix = df[numeric_cols].corr()
-            high_corr = []
-            for i in range(len(corr_matrix.columns)):
-                for j in range(i+1, len(corr_matrix.columns)):
-                    if abs(corr_matrix.iloc[i, j]) > 0.9:
-                        high_corr.append((corr_matrix.columns[i], corr_matrix.columns[j]))
-            
-            if high_corr:
-                recommendations.append("🔗 Highly correlated features detected - consider dimensionality reduction")
+        sample_rows = self.max_sample if len(df) > _ML_SAMPLE_THRESHOLD_ROWS else None
+        if len(numeric_cols) > 1 and cache.has_correlation_above(df, 0.9, max_rows=sample_rows):
+            recommendations.append("🔗 Highly correlated features detected - consider dimensionality reduction")
         
         # Model selection recommendations
         if len(df) < 1000 and len(df.columns) > 50:
@@ -839,10 +1161,12 @@ class DataQualityAnalyst:
         # Get ML-focused recommendations from the DataFrame
         # We need to reconstruct the DataFrame context here, but for now use traditional approach
         
+        by_severity = _index_by_severity(quality_report)
+        
         # Missing values recommendations
-        for column, info in quality_report['missing_values'].items():
-            if info['severity'] in ['high', 'critical']:
-                recommendations.append(f"Address missing values in '{column}' ({info['missing_percentage']}% missing)")
+        missing = by_severity['missing_values']
+        for _, column, info in sorted(missing['critical'] + missing['high']):
+            recommendations.append(f"Address missing values in '{column}' ({info['missing_percentage']}% missing)")
         
         # Duplicate recommendations
         if quality_report['duplicates']['severity'] in ['medium', 'high']:
@@ -854,9 +1178,8 @@ class DataQualityAnalyst:
                 recommendations.extend([f"{column}: {suggestion}" for suggestion in info['suggestions']])
         
         # Outlier recommendations
-        for column, info in quality_report['outliers'].items():
-            if info['severity'] == 'high':
-                recommendations.append(f"Investigate outliers in '{column}' ({info['outlier_count']} outliers)")
+        for _, column, info in by_severity['outliers']['high']:
+            recommendations.append(f"Investigate outliers in '{column}' ({info['outlier_count']} outliers)")
         
         # Consistency recommendations
         if quality_report['consistency']['severity'] in ['medium', 'high']:
@@ -865,17 +1188,21 @@ class DataQualityAnalyst:
         # Add ML readiness info if available
         if 'data_quality_score' in quality_report:
             score_info = quality_report['data_quality_score']
-            recommendations.append(f"🎯 ML Readiness: {score_info.get('ml_readiness_level', 'Unknown')} (Score: {score_info.get('overall_score', 0):.1f}/100)")
+            recommendations.append(f"{_READINESS_PREFIX} ML Readiness: {score_info.get('ml_readiness_level', 'Unknown')} (Score: {score_info.get('overall_score', 0):.1f}/100)")
             
             # Add critical issues
             critical_issues = score_info.get('critical_issues', [])
             for issue in critical_issues[:3]:  # Limit to top 3
-                recommendations.append(f"⚠️ {issue}")
+                recommendations.append(f"{_CRITICAL_ISSUE_PREFIX} {issue}")
         
         # General recommendations
         if len(recommendations) == 0:
             recommendations.append("Data quality looks good! No major issues detected.")
         else:
-            recommendations.insert(0, f"Found {len([r for r in recommendations if not r.startswith('🎯') and not r.startswith('⚠️')])} data quality issues that need attention.")
+            issue_count = sum(
+                1 for r in recommendations
+                if not r.startswith((_READINESS_PREFIX, _CRITICAL_ISSUE_PREFIX))
+            )
+            recommendations.insert(0, f"Found {issue_count} data quality issues that need attention.")
         
         return recommendations
@@ -6,6 +6,7 @@ Responsible for identifying business domain and providing domain-specific insigh
 from crewai import Agent
 from typing import Dict, Any, List
 import pandas as pd
+import numpy as np
 import re
 
 
@@ -69,6 +70,19 @@ class DomainExpert:
             ]
         }
         
+        # One compiled alternation per domain, so a single scan of a text tells whether
+        # any of the domain's keywords occurs in it
+        self._domain_regex = {
+            domain: re.compile('|'.join(map(re.escape, keywords)))
+            for domain, keywords in self.domain_patterns.items()
+        }
+        
+        # Keyword -> domains listing it, for hash lookups of whole words
+        self._keyword_domains: Dict[str, List[str]] = {}
+        for domain, keywords in self.domain_patterns.items():
+            for keyword in keywords:
+                self._keyword_domains.setdefault(keyword, []).append(domain)
+        
     def create_agent(self) -> Agent:
         """Create the Domain Expert agent"""
         return Agent(
@@ -203,11 +217,16 @@ class DomainExpert:
         for column in columns:
             column_lower = column.lower().replace('_', ' ').replace('-', ' ')
             
-            for domain, keywords in self.domain_patterns.items():
-                for keyword in keywords:
-                    if keyword in column_lower:
-                        domain_scores[domain] += 1.0 / total_columns
-                        break
+            # Words that are keywords resolve by lookup; only the remaining domains
+            # need a substring search (e.g. 'revenue' inside 'revenues')
+            matched = {
+                domain
+                for token in column_lower.split()
+                for domain in self._keyword_domains.get(token, ())
+            }
+            for domain, pattern in self._domain_regex.items():
+                if domain in matched or pattern.search(column_lower):
+                    domain_scores[domain] += 1.0 / total_columns
         
         return domain_scores
     
@@ -220,11 +239,9 @@ class DomainExpert:
         
         filename_lower = filename.lower().replace('_', ' ').replace('-', ' ')
         
-        for domain, keywords in self.domain_patterns.items():
-            for keyword in keywords:
-                if keyword in filename_lower:
-                    domain_scores[domain] += 0.5
-                    break
+        for domain, pattern in self._domain_regex.items():
+            if pattern.search(filename_lower):
+                domain_scores[domain] += 0.5
         
         return domain_scores
     
@@ -239,15 +256,14 @@ class DomainExpert:
         
         sample_df = df.head(sample_size)
         
-        # Convert all values to strings and check for patterns
+        # Join each column's lowercased values into one text and check for patterns;
+        # keywords never contain a newline, so no match can span two values
         for column in sample_df.columns:
-            values = sample_df[column].astype(str).str.lower()
+            text = '\n'.join(sample_df[column].astype(str).str.lower().dropna())
             
-            for domain, keywords in self.domain_patterns.items():
-                for keyword in keywords:
-                    if values.str.contains(keyword, na=False).any():
-                        domain_scores[domain] += 0.2
-                        break
+            for domain, pattern in self._domain_regex.items():
+                if pattern.search(text):
+                    domain_scores[domain] += 0.2
         
         return domain_scores
     
@@ -419,9 +435,9 @@ class DomainExpert:
         categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
         
         # Get key statistics
-        key_insights = self._extract_key_insights(df, domain)
+        key_insights = self._extract_key_insights(df, domain, numeric_cols)
         trends = self._identify_trends(df, date_cols, numeric_cols)
-        patterns = self._find_patterns(df, domain)
+        patterns = self._find_patterns(df, domain, numeric_cols, categorical_cols)
         
         # Create narrative structure
         story = {
@@ -454,22 +470,32 @@ class DomainExpert:
             "recommendations": ["Explore correlations between key variables", "Identify outliers and anomalies", "Consider temporal analysis if dates are present"]
         }
     
-    def _extract_key_insights(self, df: pd.DataFrame, domain: str) -> Dict[str, Any]:
+    def _extract_key_insights(self, df: pd.DataFrame, domain: str, numeric_cols: List[str]) -> Dict[str, Any]:
         """Extract domain-specific key insights from data"""
         
-        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
         insights = {}
         
-        for col in numeric_cols[:5]:  # Top 5 numeric columns
-            col_data = df[col].dropna()
-            if len(col_data) > 0:
+        top_cols = numeric_cols[:5]  # Top 5 numeric columns
+        if not top_cols or len(df) == 0:
+            return insights
+        
+        # All summary statistics from one aggregation; nulls are skipped as dropna() did
+        subset = df[top_cols]
+        stats = subset.agg(['mean', 'median', 'std', 'min', 'max'])
+        counts = subset.count()
+        # First and last non-null value of every column, for the trend direction
+        first_values = subset.bfill().iloc[0]
+        last_values = subset.ffill().iloc[-1]
+        
+        for col in top_cols:
+            if counts[col] > 0:
                 insights[col] = {
-                    'mean': col_data.mean(),
-                    'median': col_data.median(),
-                    'std': col_data.std(),
-                    'min': col_data.min(),
-                    'max': col_data.max(),
-                    'trend': 'increasing' if col_data.iloc[-1] > col_data.iloc[0] else 'decreasing' if len(col_data) > 1 else 'stable'
+                    'mean': stats.at['mean', col],
+                    'median': stats.at['median', col],
+                    'std': stats.at['std', col],
+                    'min': stats.at['min', col],
+                    'max': stats.at['max', col],
+                    'trend': 'increasing' if last_values[col] > first_values[col] else 'decreasing' if counts[col] > 1 else 'stable'
                 }
         
         return insights
@@ -499,14 +525,11 @@ class DomainExpert:
         
         return trends
     
-    def _find_patterns(self, df: pd.DataFrame, domain: str) -> List[str]:
+    def _find_patterns(self, df: pd.DataFrame, domain: str, numeric_cols: List[str],
+                       categorical_cols: List[str]) -> List[str]:
         """Find domain-specific patterns"""
         patterns = []
         
-        # High-level pattern detection
-        categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
-        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-        
         # Category distribution patterns
         for col in categorical_cols[:2]:
             value_counts = df[col].value_counts()
@@ -517,14 +540,17 @@ class DomainExpert:
         
         # Correlation patterns
         if len(numeric_cols) >= 2:
-            corr_matrix = df[numeric_cols].corr()
+            corr_matrix = df[numeric_cols].corr().to_numpy()
+            
+            # Upper-triangle pairs in row-major order, thresholded in one pass
+            rows, cols = np.triu_indices(len(numeric_cols), k=1)
+            values = corr_matrix[rows, cols]
+            strong = np.abs(values) > 0.7
+            
             strong_corrs = []
-            for i in range(len(numeric_cols)):
-                for j in range(i+1, len(numeric_cols)):
-                    corr_val = corr_matrix.iloc[i, j]
-                    if abs(corr_val) > 0.7:
-                        relationship = "strong positive" if corr_val > 0 else "strong negative"
-                        strong_corrs.append(f"{relationship} correlation between {numeric_cols[i]} and {numeric_cols[j]}")
+            for i, j, corr_val in zip(rows[strong], cols[strong], values[strong]):
+                relationship = "strong positive" if corr_val > 0 else "strong negative"
+                strong_corrs.append(f"{relationship} correlation between {numeric_cols[i]} and {numeric_cols[j]}")
             patterns.extend(strong_corrs[:3])
         
         return patterns
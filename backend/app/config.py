@@ -16,7 +16,9 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ENGINE_OPTIONS = {
         'pool_size': 10,
-        'pool_recycle': 60,
+        'max_overflow': 20,
+        'pool_timeout': 30,
+        'pool_recycle': 3600,
         'pool_pre_ping': True
     }
     
@@ -65,3 +67,8 @@ class ProductionConfig(Config):
     SESSION_COOKIE_SECURE = True
     SESSION_COOKIE_HTTPONLY = True
     SESSION_COOKIE_SAMESITE = 'Strict'
+
+
+# Uppercase settings of the base Config, collected once at import so
+# create_app can copy them without reflecting over the class each time
+CONFIG_DICT = {key: getattr(Config, key) for key in dir(Config) if key.isupper()}
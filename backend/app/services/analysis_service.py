@@ -9,6 +9,7 @@ import warnings
 import pandas as pd
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError
 
 # Suppress Google Cloud and gRPC warnings
@@ -21,10 +22,6 @@ warnings.filterwarnings("ignore", category=UserWarning, module="google.*")
 from app.models import DatasetAnalysis, DataPoint, ProcessingStatus
 from app import db
 from app.utils.json_serializer import prepare_for_jsonb
-from app.agents.data_quality_analyst import DataQualityAnalyst
-from app.agents.domain_expert import DomainExpert
-from app.agents.kpi_strategist import KPIStrategist
-from app.agents.dashboard_designer import DashboardDesigner
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -56,6 +53,12 @@ class AnalysisService:
         # Initialize AI agents
         if self.llm:
             try:
+                # Agents pull in crewai, so only import them when they are used
+                from app.agents.data_quality_analyst import DataQualityAnalyst
+                from app.agents.domain_expert import DomainExpert
+                from app.agents.kpi_strategist import KPIStrategist
+                from app.agents.dashboard_designer import DashboardDesigner
+                
                 self.data_quality_analyst = DataQualityAnalyst({'model': self.llm})
                 self.domain_expert = DomainExpert({'model': self.llm})
                 self.kpi_strategist = KPIStrategist({'model': self.llm})
@@ -175,20 +178,19 @@ class AnalysisService:
             # Limit to first 1000 rows for performance
             sample_df = df.head(1000)
             
-            data_points = []
-            for idx, row in sample_df.iterrows():
-                # Convert the row to dict and clean NaN values
-                row_data = row.to_dict()
-                cleaned_data = prepare_for_jsonb(row_data)
-                
-                data_point = DataPoint(
-                    dataset_id=analysis_id,
-                    row_index=int(idx),
-                    data=cleaned_data
-                )
-                data_points.append(data_point)
+            # Convert rows to dicts in one pass and clean NaN values
+            data_points = [
+                {
+                    'dataset_id': analysis_id,
+                    'row_index': int(idx),
+                    'data': prepare_for_jsonb(row_data)
+                }
+                for idx, row_data in zip(sample_df.index, sample_df.to_dict('records'))
+            ]
             
-            db.session.bulk_save_objects(data_points)
+            # Single executemany INSERT instead of per-object ORM flushes
+            if data_points:
+                db.session.execute(insert(DataPoint), data_points)
             db.session.commit()
             
         except Exception as e:
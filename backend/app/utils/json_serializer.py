@@ -4,10 +4,12 @@ JSON Serialization utilities for handling numpy and pandas types
 
 import json
 import numpy as np
+import orjson
 import pandas as pd
 from datetime import datetime, date
 from decimal import Decimal
 from enum import Enum
+from flask.json.provider import JSONProvider
 
 
 class CustomJSONEncoder(json.JSONEncoder):
@@ -38,6 +40,33 @@ class CustomJSONEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _orjson_default(obj):
+    """Fallback for types orjson cannot serialize natively"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    elif isinstance(obj, Enum):
+        return obj.value
+    elif isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    elif pd.isna(obj):
+        return None
+    elif hasattr(obj, 'item'):  # numpy/pandas scalar
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for faster API responses"""
+    
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_orjson_default, option=self.option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 def safe_json_serialize(data):
     """Safely serialize data to JSON with custom encoder"""
     return json.dumps(data, cls=CustomJSONEncoder, ensure_ascii=False)
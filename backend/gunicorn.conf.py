@@ -0,0 +1,15 @@
+import multiprocessing
+import os
+
+# Server socket
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+
+# Worker processes; threaded workers let DB-bound requests overlap without
+# monkey-patching psycopg2 the way gevent would require
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+
+# Analysis requests run the full agent pipeline synchronously
+timeout = 300
+keepalive = 5